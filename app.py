@@ -3,16 +3,26 @@ Simple web app for UK BESS scraper.
 Press a button to start scraping; get status and download results.
 """
 
+import hashlib
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from pathlib import Path
 
 from flask import Flask, jsonify, request, send_file, send_from_directory
 
+try:
+    import orjson  # much faster JSON parse/serialize; optional
+except ImportError:
+    orjson = None
+
 import config as cfg
 
 # Force terminal output to show immediately (no buffering)
@@ -38,6 +48,9 @@ from scrapers.uk_run_all import run_all_uk_sources
 from scrapers.investment_scope import write_investment_scope_summary, build_investment_scope_summary
 
 app = Flask(__name__, static_folder="static", static_url_path="")
+# Static assets (logo etc.) are effectively immutable between deploys: cache for a day.
+# index.html is revalidated via ETag (see index()) so UI updates are picked up immediately.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 86400
 
 # In-memory state for scrape status (single worker)
 _scrape_state = {
@@ -52,21 +65,131 @@ _scrape_state = {
 _lock = threading.Lock()
 _scrape_log_path = None  # set when output dir is known
 
+# One persistent worker for scrape jobs: no per-click thread creation, and max_workers=1
+# guarantees scrapes never overlap even if the 'running' check races.
+_scrape_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper")
+
+# Scrape work (HTML/CSV parsing) runs in a separate process so it doesn't hold this
+# app's GIL and stall API responses mid-scrape. Created lazily; one worker is enough.
+_scrape_process = None
+
+
+def _scrape_process_pool():
+    global _scrape_process
+    if _scrape_process is None:
+        from concurrent.futures import ProcessPoolExecutor
+        _scrape_process = ProcessPoolExecutor(max_workers=1)
+    return _scrape_process
+
+
+def _scrape_job(base: str, date_suffix: str) -> tuple[int, dict]:
+    """Run the full scrape and write output files. Module-level (picklable) so it can run
+    in the worker process; also callable in-process as a fallback. Returns (row_count, summary)."""
+    cfg.OUTPUT_DIR = os.path.join(base, "output", cfg.OUTPUT_UK_SUBDIR)
+    Path(cfg.OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+    rows = run_all_uk_sources(
+        save_merged_csv=True,
+        save_merged_json=True,
+        date_suffix=date_suffix,
+    )
+    summary = build_investment_scope_summary(rows, run_date=date_suffix)
+    write_investment_scope_summary(rows, output_dir=cfg.OUTPUT_DIR, date_suffix=date_suffix)
+    return len(rows), summary
+
+# Memoized CSV summaries keyed by path -> (st_mtime_ns, st_size, summary dict).
+# The UI polls /api/status every few seconds; re-parsing an unchanged file is pure waste.
+# Only the dict is cached: every endpoint embeds the summary in a larger response,
+# so pre-serialized summary bytes could never be sent as-is.
+_SUMMARY_CACHE: dict[str, tuple[int, int, dict]] = {}
+_summary_cache_lock = threading.Lock()
+
+
+def _summary_cache_get(path: str):
+    """Return (cached summary, stat key) for path if file is unchanged, else (None, stat key)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    stat_key = (st.st_mtime_ns, st.st_size)
+    with _summary_cache_lock:
+        cached = _SUMMARY_CACHE.get(path)
+    if cached and (cached[0], cached[1]) == stat_key:
+        return cached[2], stat_key
+    return None, stat_key
+
+
+def _summary_cache_put(path: str, stat_key: tuple, summary: dict):
+    if not stat_key:
+        return
+    with _summary_cache_lock:
+        _SUMMARY_CACHE[path] = (stat_key[0], stat_key[1], summary)
+
+
+# Background writer: log/status file writes go through a queue so request and scraper
+# threads never block on disk I/O. Writes stay ordered (single drain thread).
+_write_queue: queue.Queue = queue.Queue()
+
+
+def _drain_write_queue():
+    while True:
+        task = _write_queue.get()
+        try:
+            task()
+        except Exception:
+            pass
+        finally:
+            _write_queue.task_done()
+
+
+_write_thread = threading.Thread(target=_drain_write_queue, daemon=True, name="file-writer")
+_write_thread.start()
+
+
+def _flush_writes():
+    """Block until all queued file writes have hit disk (e.g. before reporting 'done')."""
+    _write_queue.join()
+
+
+# Rotation caps for scrape_log.txt / bot_log.txt so long-lived deployments don't grow them unbounded
+_LOG_MAX_BYTES = 1_000_000
+_LOG_BACKUP_COUNT = 3
+_log_handlers: dict[str, logging.handlers.RotatingFileHandler] = {}
+_log_handlers_lock = threading.Lock()
+
+
+def _append_line(path: str, line: str):
+    """Append one line via a cached RotatingFileHandler (kept open; rotates at _LOG_MAX_BYTES)."""
+    with _log_handlers_lock:
+        handler = _log_handlers.get(path)
+        if handler is None:
+            handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=_LOG_MAX_BYTES, backupCount=_LOG_BACKUP_COUNT, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            _log_handlers[path] = handler
+    handler.emit(logging.LogRecord("scrape", logging.INFO, "", 0, line, None, None))
+
+
+def _dump_status_json(payload: dict, path: str):
+    """Write an indented JSON status file; orjson when available, stdlib otherwise."""
+    if orjson:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
 
 def _scrape_log(msg: str):
     """Write scrape message to terminal and to a log file (so you always have a record)."""
     print(msg, flush=True)
     path = _scrape_log_path
     if path:
-        try:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
-        except Exception:
-            pass
+        _write_queue.put(lambda: _append_line(path, msg))
 
 
 def _run_scraper():
-    global _scrape_state, _scrape_log_path
+    global _scrape_state, _scrape_log_path, _scrape_process
     with _lock:
         _scrape_state["status"] = "running"
         _scrape_state["started_at"] = datetime.now(timezone.utc).isoformat()
@@ -77,8 +200,9 @@ def _run_scraper():
         _scrape_state["error"] = None
 
     try:
+        # Absolute paths throughout (no os.chdir): chdir is process-global and would
+        # race with request handlers and the worker process resolving relative paths.
         base = os.path.dirname(os.path.abspath(__file__))
-        os.chdir(base)
         cfg.OUTPUT_DIR = os.path.join(base, "output", cfg.OUTPUT_UK_SUBDIR)
         Path(cfg.OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
         _scrape_log_path = os.path.join(cfg.OUTPUT_DIR, "scrape_log.txt")
@@ -87,29 +211,30 @@ def _run_scraper():
         _scrape_log(f"[Scrape] Output dir: {cfg.OUTPUT_DIR}")
         date_suffix = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-        rows = run_all_uk_sources(
-            save_merged_csv=True,
-            save_merged_json=True,
-            date_suffix=date_suffix,
-        )
-        _scrape_log(f"[Scrape] Gathered {len(rows)} rows (deduplicated)")
-        summary = build_investment_scope_summary(rows, run_date=date_suffix)
-        write_investment_scope_summary(rows, output_dir=cfg.OUTPUT_DIR, date_suffix=date_suffix)
+        try:
+            n_rows, summary = _scrape_process_pool().submit(_scrape_job, base, date_suffix).result()
+        except (BrokenProcessPool, OSError) as e:
+            # Worker process died or couldn't start (e.g. constrained container): run in-process
+            _scrape_process = None
+            _scrape_log(f"[Scrape] Worker process unavailable ({e}); running in-process")
+            n_rows, summary = _scrape_job(base, date_suffix)
+        _scrape_log(f"[Scrape] Gathered {n_rows} rows (deduplicated)")
 
         total_mw = summary.get("total_mw") or 0
         finished_at = datetime.now(timezone.utc)
         finished_str = finished_at.strftime("%H:%M") if finished_at else ""
         scrape_summary = (
-            f"{len(rows)} unique projects (deduplicated) · {total_mw:,.0f} MW total · "
+            f"{n_rows} unique projects (deduplicated) · {total_mw:,.0f} MW total · "
             f"Completed at {finished_str}. Download bess_uk_multi_source for the full dataset."
         )
         # Write bot_status and bot_log BEFORE updating state so when client sees "done", files exist
         _write_bot_status(summary, output_dir=cfg.OUTPUT_DIR)
-        _scrape_log(f"[Scrape] Done. {len(rows)} projects, {total_mw:,.0f} MW. Files saved to {cfg.OUTPUT_DIR}")
+        _scrape_log(f"[Scrape] Done. {n_rows} projects, {total_mw:,.0f} MW. Files saved to {cfg.OUTPUT_DIR}")
+        _flush_writes()
         with _lock:
             _scrape_state["status"] = "done"
             _scrape_state["finished_at"] = finished_at.isoformat()
-            _scrape_state["project_count"] = len(rows)
+            _scrape_state["project_count"] = n_rows
             _scrape_state["summary"] = summary
             _scrape_state["scrape_summary"] = scrape_summary
             _scrape_state["error"] = None
@@ -124,7 +249,11 @@ def _run_scraper():
 
 @app.route("/")
 def index():
-    return send_from_directory(app.static_folder, "index.html")
+    # conditional=True sends 304 Not Modified on If-None-Match/If-Modified-Since,
+    # so repeat visits skip the body transfer while still seeing new deploys.
+    resp = send_from_directory(app.static_folder, "index.html", conditional=True, max_age=0)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
 
 
 @app.route("/api/status", methods=["GET"])
@@ -134,7 +263,9 @@ def api_status():
         state = dict(_scrape_state)
     if state.get("status") == "idle" and state.get("summary") is None:
         out_uk = _out_uk_dir()
-        disk = _load_summary_from_multi_source_csv(out_uk) or _load_latest_summary_from_disk(out_uk)
+        _, multi_source_path = _scan_output_files(out_uk)
+        disk = _load_summary_from_multi_source_csv(out_uk, multi_source_path=multi_source_path) \
+            or _load_latest_summary_from_disk(out_uk)
         if disk and (disk.get("total_projects") or 0) >= 50:
             state["summary"] = disk
             state["project_count"] = disk.get("total_projects")
@@ -142,7 +273,12 @@ def api_status():
                 f"{disk.get('total_projects')} unique projects (deduplicated) · "
                 f"{disk.get('total_mw') or 0:,.0f} MW total · From latest run on disk."
             )
-    return jsonify(state)
+    # ETag from the response body: the UI polls every few seconds, so an unchanged
+    # state answers If-None-Match with an empty 304 instead of re-sending the summary.
+    body = orjson.dumps(state) if orjson else json.dumps(state).encode("utf-8")
+    resp = app.response_class(body, mimetype="application/json")
+    resp.set_etag(hashlib.md5(body).hexdigest())
+    return resp.make_conditional(request)
 
 
 @app.route("/api/scrape", methods=["POST"])
@@ -155,15 +291,57 @@ def api_scrape():
         global _scrape_log_path
         _scrape_log_path = os.path.join(out_uk, "scrape_log.txt")
     _scrape_log("\n[Scrape] Button clicked - starting scrape in background...")
-    thread = threading.Thread(target=_run_scraper)
-    thread.start()
+    _scrape_executor.submit(_run_scraper)
     return jsonify({"status": "running", "message": "Scrape started"})
 
 
+# Resolved once at import: the app location and OUTPUT_UK_SUBDIR never change at runtime,
+# so there's no need to re-run realpath/abspath on every request.
+_OUT_UK_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "output", cfg.OUTPUT_UK_SUBDIR
+)
+
+
 def _out_uk_dir():
     """Absolute path to output/uk, always relative to app.py (same place scraper writes)."""
-    base = os.path.dirname(os.path.abspath(os.path.realpath(__file__)))
-    return os.path.join(base, "output", cfg.OUTPUT_UK_SUBDIR)
+    return _OUT_UK_DIR
+
+
+def _scan_output_files(out_uk: str):
+    """One os.scandir pass over out_uk: CSV/JSON files with mtimes plus the newest multi_source CSV.
+    scandir reuses the stat from the directory entry, so this is one syscall per file instead of two.
+    Returns (files, latest_multi_source_path); files entries are {"name", "updated"}."""
+    files = []
+    latest_multi = None
+    latest_mtime = -1.0
+    if not os.path.isdir(out_uk):
+        return files, None
+    try:
+        entries = os.scandir(out_uk)
+    except OSError:
+        return files, None
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith((".csv", ".json")):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+            except OSError:
+                files.append({"name": name, "updated": None})
+                continue
+            files.append({"name": name, "updated": datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()})
+            if "multi_source" in name and name.endswith(".csv") and mtime > latest_mtime:
+                latest_mtime = mtime
+                latest_multi = entry.path
+    return files, latest_multi
+
+
+# Digest of the last bot_status payload written (excluding last_run_at), per path:
+# identical results don't get re-serialized and re-written on every run.
+_bot_status_digests: dict[str, str] = {}
 
 
 def _write_bot_status(summary: dict, error: str | None = None, output_dir: str | None = None):
@@ -190,40 +368,122 @@ def _write_bot_status(summary: dict, error: str | None = None, output_dir: str |
             "ma_offtake": summary.get("count_ma_offtake", 0),
         },
     }
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
-    except Exception:
-        pass
     # Append to bot_log.txt so "Recent log" in UI shows web app runs too
     log_path = os.path.join(out_uk, "bot_log.txt")
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{ts}] [Web app] Scrape done. {payload['total_projects']} projects, {payload['total_mw']:,.0f} MW." if error is None else f"[{ts}] [Web app] Scrape failed: {error}"
+
+    # Skip the JSON rewrite when the results (everything but the timestamp) are unchanged;
+    # the log line is still appended, so every run remains visible in "Recent log".
+    digest = hashlib.sha256(
+        json.dumps({k: v for k, v in payload.items() if k != "last_run_at"}, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    unchanged = _bot_status_digests.get(path) == digest and os.path.isfile(path)
+    _bot_status_digests[path] = digest
+
+    def _do_write():
+        if not unchanged:
+            _dump_status_json(payload, path)
+        _append_line(log_path, line)
+
+    _write_queue.put(_do_write)
+
+
+# Precompiled value -> summary-counter-key lookups, so the per-row fallback loop below
+# is a dict probe instead of chained if/elif substring checks.
+_STATUS_COUNTER_KEY = {
+    "planned": "count_planned",
+    "consented": "count_consented",
+    "in-construction": "count_in_construction",
+    "operational": "count_operational",
+}
+_OPPORTUNITY_COUNTER_KEY = {
+    "Early-stage development": "count_early_stage_development",
+    "Construction / finance": "count_construction_finance",
+    "M&A / offtake / operations": "count_ma_offtake",
+}
+
+
+def _opportunity_counter_key(opp: str) -> str | None:
+    """Counter key for an investment_opportunity value; substring fallback for non-standard text."""
+    if not opp:
+        return None
+    key = _OPPORTUNITY_COUNTER_KEY.get(opp)
+    if key:
+        return key
+    if "Early-stage" in opp:
+        return "count_early_stage_development"
+    if "Construction" in opp or "finance" in opp:
+        return "count_construction_finance"
+    if "M&A" in opp or "offtake" in opp:
+        return "count_ma_offtake"
+    return None
+
+
+def _summarize_multi_source_csv_pyarrow(path: str):
+    """Columnar summary of a multi_source CSV via pyarrow.compute (no per-row Python dicts).
+    Returns the same dict as the DictReader path, or None if pyarrow is unavailable or the read fails."""
+    try:
+        import pyarrow.csv as pa_csv
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
     try:
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=["status", "investment_opportunity", "capacity_mw_numeric"],
+                column_types={"capacity_mw_numeric": "float64"},
+            ),
+        )
     except Exception:
-        pass
+        return None
+    n = table.num_rows
+    if not n:
+        return None
+    status = pc.replace_substring(
+        pc.utf8_lower(pc.utf8_trim_whitespace(pc.cast(table["status"], "string"))), " ", "-"
+    )
+    opp = pc.cast(table["investment_opportunity"], "string")
+
+    def _count_eq(value):
+        return pc.sum(pc.cast(pc.equal(status, value), "int64")).as_py() or 0
+
+    def _count_contains(pattern):
+        return pc.sum(pc.cast(pc.match_substring(opp, pattern), "int64")).as_py() or 0
+
+    total_mw = pc.sum(table["capacity_mw_numeric"]).as_py() or 0.0
+    return {
+        "run_date": "",
+        "run_at": "",
+        "total_projects": n,
+        "total_mw": round(float(total_mw), 1),
+        "count_planned": _count_eq("planned"),
+        "count_consented": _count_eq("consented"),
+        "count_in_construction": _count_eq("in-construction"),
+        "count_operational": _count_eq("operational"),
+        "count_early_stage_development": _count_contains("Early-stage"),
+        "count_construction_finance": _count_contains("Construction"),
+        "count_ma_offtake": _count_contains("M&A"),
+    }
 
 
 def _load_summary_from_multi_source_csv(out_uk: str, multi_source_path: str = None):
     """Build summary from bess_uk_multi_source*.csv. If multi_source_path is given, read that file; else find latest in out_uk."""
     import csv
     path = multi_source_path
-    if not path and out_uk and os.path.isdir(out_uk):
-        candidates = []
-        for name in os.listdir(out_uk):
-            if "multi_source" in name and name.endswith(".csv"):
-                p = os.path.join(out_uk, name)
-                if os.path.isfile(p):
-                    try:
-                        candidates.append((p, os.path.getmtime(p)))
-                    except OSError:
-                        pass
-        if candidates:
-            path = max(candidates, key=lambda x: x[1])[0]
+    if not path and out_uk:
+        _, path = _scan_output_files(out_uk)
     if not path or not os.path.isfile(path):
         return None
+    cached, stat_key = _summary_cache_get(path)
+    if cached is not None:
+        return cached
+    # Columnar scan (pyarrow) is much faster than DictReader on big files; fall back below if unavailable
+    summary = _summarize_multi_source_csv_pyarrow(path)
+    if summary is not None:
+        _summary_cache_put(path, stat_key, summary)
+        return summary
     try:
         with open(path, "r", newline="", encoding="utf-8-sig") as f:
             rows = list(csv.DictReader(f))
@@ -231,46 +491,38 @@ def _load_summary_from_multi_source_csv(out_uk: str, multi_source_path: str = No
         return None
     if not rows:
         return None
-    count_planned = count_consented = count_in_construction = count_operational = 0
-    count_early_stage = count_construction_finance = count_ma_offtake = 0
+    counts = {
+        "count_planned": 0,
+        "count_consented": 0,
+        "count_in_construction": 0,
+        "count_operational": 0,
+        "count_early_stage_development": 0,
+        "count_construction_finance": 0,
+        "count_ma_offtake": 0,
+    }
     total_mw = 0.0
     for r in rows:
-        status = (r.get("status") or "").strip().lower().replace(" ", "-")
-        if status == "planned":
-            count_planned += 1
-        elif status == "consented":
-            count_consented += 1
-        elif status == "in-construction":
-            count_in_construction += 1
-        elif status == "operational":
-            count_operational += 1
-        opp = (r.get("investment_opportunity") or "").strip()
-        if "Early-stage" in opp:
-            count_early_stage += 1
-        elif "Construction" in opp or "finance" in opp:
-            count_construction_finance += 1
-        elif "M&A" in opp or "offtake" in opp:
-            count_ma_offtake += 1
+        status_key = _STATUS_COUNTER_KEY.get((r.get("status") or "").strip().lower().replace(" ", "-"))
+        if status_key:
+            counts[status_key] += 1
+        opp_key = _opportunity_counter_key((r.get("investment_opportunity") or "").strip())
+        if opp_key:
+            counts[opp_key] += 1
         try:
             cap = r.get("capacity_mw_numeric")
             if cap is not None and str(cap).strip():
                 total_mw += float(cap)
         except (TypeError, ValueError):
             pass
-    n = len(rows)
-    return {
+    summary = {
         "run_date": "",
         "run_at": "",
-        "total_projects": n,
+        "total_projects": len(rows),
         "total_mw": round(total_mw, 1),
-        "count_planned": count_planned,
-        "count_consented": count_consented,
-        "count_in_construction": count_in_construction,
-        "count_operational": count_operational,
-        "count_early_stage_development": count_early_stage,
-        "count_construction_finance": count_construction_finance,
-        "count_ma_offtake": count_ma_offtake,
+        **counts,
     }
+    _summary_cache_put(path, stat_key, summary)
+    return summary
 
 
 def _load_latest_summary_from_disk(out_uk: str):
@@ -279,23 +531,23 @@ def _load_latest_summary_from_disk(out_uk: str):
     path = os.path.join(out_uk, "uk_investment_scope_summary.csv")
     if not path or not os.path.isfile(path):
         return None
+    cached, stat_key = _summary_cache_get(path)
+    if cached is not None:
+        return cached
     try:
-        with open(path, "r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        if not rows:
-            return None
         best = None
         best_total = 0
-        for row in rows:
-            raw = row.get("total_projects") or row.get("Total_projects") or ""
-            try:
-                total = int(str(raw).strip())
-            except (TypeError, ValueError):
-                continue
-            if total >= 50 and total > best_total:
-                best_total = total
-                best = row
+        # Stream rows; only the current best is kept, so memory stays flat as runs accumulate
+        with open(path, "r", newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                raw = row.get("total_projects") or row.get("Total_projects") or ""
+                try:
+                    total = int(str(raw).strip())
+                except (TypeError, ValueError):
+                    continue
+                if total >= 50 and total > best_total:
+                    best_total = total
+                    best = row
         if not best:
             return None
         def _int(key):
@@ -310,7 +562,7 @@ def _load_latest_summary_from_disk(out_uk: str):
                 return float(str(v).strip())
             except (TypeError, ValueError):
                 return 0.0
-        return {
+        summary = {
             "run_date": (best.get("run_date") or "").strip(),
             "run_at": (best.get("run_at") or "").strip(),
             "total_projects": best_total,
@@ -323,6 +575,8 @@ def _load_latest_summary_from_disk(out_uk: str):
             "count_construction_finance": _int("count_construction_finance"),
             "count_ma_offtake": _int("count_ma_offtake"),
         }
+        _summary_cache_put(path, stat_key, summary)
+        return summary
     except Exception:
         return None
 
@@ -334,20 +588,7 @@ def api_results():
     if not os.path.isdir(out_uk):
         return jsonify({"files": [], "summary": None, "scrape_summary": None})
 
-    files = []
-    multi_source_candidates = []
-    for name in os.listdir(out_uk):
-        if name.endswith((".csv", ".json")):
-            path = os.path.join(out_uk, name)
-            if os.path.isfile(path):
-                try:
-                    mtime = os.path.getmtime(path)
-                    files.append({"name": name, "updated": datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()})
-                    if "multi_source" in name and name.endswith(".csv"):
-                        multi_source_candidates.append((path, mtime))
-                except OSError:
-                    files.append({"name": name, "updated": None})
-    multi_source_csv_path = max(multi_source_candidates, key=lambda x: x[1])[0] if multi_source_candidates else None
+    files, multi_source_csv_path = _scan_output_files(out_uk)
 
     summary = _load_summary_from_multi_source_csv(out_uk, multi_source_path=multi_source_csv_path)
     if summary is None:
@@ -381,7 +622,10 @@ def api_download(filename):
     path = os.path.join(out_uk, filename)
     if not os.path.isfile(path):
         return jsonify({"error": "File not found"}), 404
-    return send_file(path, as_attachment=True, download_name=filename)
+    # conditional=True: ETag/Last-Modified plus Range support, so interrupted downloads
+    # of big CSVs resume instead of restarting; body goes out via wsgi.file_wrapper
+    # (sendfile on gunicorn) rather than being read into Python.
+    return send_file(path, as_attachment=True, download_name=filename, conditional=True)
 
 
 @app.route("/api/bot/status", methods=["GET"])
@@ -392,13 +636,35 @@ def api_bot_status():
     if not os.path.isfile(path):
         return jsonify({"last_run_at": None})
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         return jsonify(data)
     except Exception:
         return jsonify({"last_run_at": None})
 
 
+def _tail_lines(path: str, n: int) -> list[str]:
+    """Read the last n lines of a text file by seeking backwards in blocks (no full-file read)."""
+    if n <= 0:
+        return []
+    block = 8192
+    chunks = []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        newlines = 0
+        while pos > 0 and newlines <= n:
+            read_size = min(block, pos)
+            pos -= read_size
+            f.seek(pos)
+            chunk = f.read(read_size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    text = b"".join(reversed(chunks)).decode("utf-8", errors="replace")
+    return [line.rstrip("\r") for line in text.splitlines()[-n:]]
+
+
 @app.route("/api/bot/log", methods=["GET"])
 def api_bot_log():
     """Return last N lines of bot_log.txt. Query param tail (default 50, max 500)."""
@@ -409,10 +675,7 @@ def api_bot_log():
     if not os.path.isfile(path):
         return jsonify({"lines": []})
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        lines = [line.rstrip("\n\r") for line in lines[-tail:]]
-        return jsonify({"lines": lines})
+        return jsonify({"lines": _tail_lines(path, tail)})
     except Exception:
         return jsonify({"lines": []})
 
@@ -421,12 +684,7 @@ def api_bot_log():
 def api_debug():
     """Return out_uk path, whether it exists, and summary from multi_source CSV (for troubleshooting)."""
     out_uk = _out_uk_dir()
-    multi_source_path = None
-    if os.path.isdir(out_uk):
-        for name in os.listdir(out_uk):
-            if "multi_source" in name and name.endswith(".csv"):
-                multi_source_path = os.path.join(out_uk, name)
-                break
+    _, multi_source_path = _scan_output_files(out_uk)
     summary = _load_summary_from_multi_source_csv(out_uk, multi_source_path=multi_source_path)
     return jsonify({
         "out_uk": out_uk,
@@ -18,12 +18,19 @@ Status: output/uk/bot_status.json (last run summary for --status)
 
 import argparse
 import json
+import logging
+import logging.handlers
 import os
 import signal
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson  # faster JSON parse/serialize; optional
+except ImportError:
+    orjson = None
+
 import config as cfg
 from scrapers.uk_run_all import run_all_uk_sources
 from scrapers.investment_scope import write_investment_scope_summary, build_investment_scope_summary
@@ -34,15 +41,26 @@ BOT_LOG_PATH = None
 BOT_STATUS_PATH = None
 
 
+# Rotate bot_log.txt at 1 MB (3 backups) so scheduled runs can't grow it unbounded
+_LOG_MAX_BYTES = 1_000_000
+_LOG_BACKUP_COUNT = 3
+_log_handler = None
+
+
 def _bot_log(msg: str):
-    """Write to bot log file and to stdout."""
+    """Write to bot log file (rotating) and to stdout."""
+    global _log_handler
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{ts}] {msg}"
     print(line, flush=True)
     if BOT_LOG_PATH:
         try:
-            with open(BOT_LOG_PATH, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            if _log_handler is None:
+                _log_handler = logging.handlers.RotatingFileHandler(
+                    BOT_LOG_PATH, maxBytes=_LOG_MAX_BYTES, backupCount=_LOG_BACKUP_COUNT, encoding="utf-8"
+                )
+                _log_handler.setFormatter(logging.Formatter("%(message)s"))
+            _log_handler.emit(logging.LogRecord("bot", logging.INFO, "", 0, line, None, None))
         except Exception:
             pass
 
@@ -70,8 +88,12 @@ def _write_status(summary: dict, error: str | None = None):
         },
     }
     try:
-        with open(BOT_STATUS_PATH, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        if orjson:
+            with open(BOT_STATUS_PATH, "wb") as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(BOT_STATUS_PATH, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
     except Exception:
         pass
 
@@ -81,8 +103,9 @@ def _read_status() -> dict | None:
     if not BOT_STATUS_PATH or not os.path.isfile(BOT_STATUS_PATH):
         return None
     try:
-        with open(BOT_STATUS_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(BOT_STATUS_PATH, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson else json.loads(raw)
     except Exception:
         return None
 
@@ -92,8 +115,8 @@ def run_scrape():
     Run the full UK scrape (same as web app / main.py).
     Returns (num_rows, summary_dict). On failure returns (-1, {}) and logs error.
     """
+    # Absolute output path; no os.chdir (process-global and surprising for callers)
     base = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(base)
     cfg.OUTPUT_DIR = os.path.join(base, "output", cfg.OUTPUT_UK_SUBDIR)
     Path(cfg.OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
     date_suffix = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -112,12 +135,10 @@ def run_scrape():
         mw = summary.get("total_mw") or 0
         _bot_log(f"Scrape done. {n} projects, {mw:,.0f} MW. Output: {cfg.OUTPUT_DIR}")
 
-        # Log breakdown
+        # Log breakdown (single write: both lines in one record/flush)
         _bot_log(
             f"  Status: planned={summary.get('count_planned',0)} consented={summary.get('count_consented',0)} "
-            f"in_construction={summary.get('count_in_construction',0)} operational={summary.get('count_operational',0)}"
-        )
-        _bot_log(
+            f"in_construction={summary.get('count_in_construction',0)} operational={summary.get('count_operational',0)}\n"
             f"  Opportunity: early_stage={summary.get('count_early_stage_development',0)} "
             f"construction_finance={summary.get('count_construction_finance',0)} ma_offtake={summary.get('count_ma_offtake',0)}"
         )
@@ -171,7 +192,7 @@ def show_status():
 def run_scheduled(time_str: str | None = None, interval_seconds: int | None = None, run_now: bool = False):
     """Run scrape on a schedule; keeps running until interrupted. Handles Ctrl+C gracefully."""
     import schedule
-    import time as time_module
+    import threading
 
     run_at = time_str or BOT_SCHEDULE_TIME
     _bot_log(f"Bot started. Schedule: daily at {run_at} UTC" +
@@ -188,19 +209,24 @@ def run_scheduled(time_str: str | None = None, interval_seconds: int | None = No
         _bot_log("Running once now (--run-now)...")
         run_scrape()
 
-    shutdown = [False]  # closure so signal handler can set it
+    shutdown = threading.Event()  # set by signal handler so the wait below wakes immediately
 
     def _handle_signal(signum, frame):
-        shutdown[0] = True
+        shutdown.set()
         _bot_log("Shutting down gracefully (Ctrl+C or SIGTERM)...")
 
     signal.signal(signal.SIGINT, _handle_signal)
     if hasattr(signal, "SIGTERM"):
         signal.signal(signal.SIGTERM, _handle_signal)
 
-    while not shutdown[0]:
+    # Sleep until the next scheduled job instead of waking every 30s; Event.wait
+    # returns immediately on shutdown. Cap the wait so clock changes are picked up.
+    while not shutdown.is_set():
         schedule.run_pending()
-        time_module.sleep(30)
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break  # no jobs left
+        shutdown.wait(timeout=max(0.5, min(idle, 3600)))
     _bot_log("Bot stopped.")
 
 
@@ -44,6 +44,11 @@ def main() -> int:
         action="store_true",
         help="Do not write JSON output",
     )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write gzipped outputs (.csv.gz/.json.gz) – useful for weekly archives",
+    )
     parser.add_argument(
         "--no-summary",
         action="store_true",
@@ -63,13 +68,14 @@ def main() -> int:
     import config as cfg
     cfg.OUTPUT_DIR = f"{args.output_dir.rstrip('/')}/{OUTPUT_UK_SUBDIR}"
 
+    # Filter inside the run so excluded rows are never deduplicated or serialized
     uk_rows = run_all_uk_sources(
         save_merged_csv=save_csv,
         save_merged_json=save_json,
         date_suffix=date_suffix,
+        status_filter=LATEST_STATUSES if args.latest_only else None,
+        compress=args.compress,
     )
-    if args.latest_only:
-        uk_rows = [r for r in uk_rows if (r.get("status") or "").strip() in LATEST_STATUSES]
 
     print(f"UK: scraped {len(uk_rows)} BESS projects (deduplicated across sources)" + (" (pipeline only)" if args.latest_only else ""))
 
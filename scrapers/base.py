@@ -1,15 +1,22 @@
 """Base utilities for BESS scrapers."""
 
 import csv as csv_module
+import gzip
+import hashlib
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config import OUTPUT_DIR, DEFAULT_ENCODING
 
 USER_AGENT = (
@@ -20,28 +27,51 @@ REQUEST_TIMEOUT = 45
 REQUEST_RETRIES = 3
 REQUEST_BACKOFF = 2
 
+# Shared session so TCP/TLS connections are pooled and reused across calls and
+# across scraper threads (sources run concurrently in uk_run_all).
+# max_retries=0: retries/backoff are handled by the wrappers below, not urllib3.
+_session = requests.Session()
+_session.headers.update({"User-Agent": USER_AGENT})
+_adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+def _should_retry(err: Exception) -> bool:
+    """Client errors (4xx except 429) won't heal on retry; fail fast on them."""
+    resp = getattr(err, "response", None)
+    if resp is not None and 400 <= resp.status_code < 500 and resp.status_code != 429:
+        return False
+    return True
+
 
 def fetch_html_with_retry(
     url: str,
     params: dict | None = None,
     timeout: int = REQUEST_TIMEOUT,
-    retries: int = REQUEST_RETRIES,
-    backoff: float = REQUEST_BACKOFF,
+    retries: int | None = None,
+    backoff: float | None = None,
 ) -> str:
-    """Fetch HTML with retries and backoff. Raises on repeated failure."""
+    """Fetch HTML with retries and backoff. Raises on repeated failure.
+    retries/backoff default to the module profile at call time, so aggregate
+    runs can tighten them for every scraper at once."""
+    retries = REQUEST_RETRIES if retries is None else retries
+    backoff = REQUEST_BACKOFF if backoff is None else backoff
     last_err = None
     for attempt in range(retries):
         try:
-            resp = requests.get(
+            resp = _session.get(
                 url,
                 params=params,
-                headers={"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"},
+                headers={"Accept": "text/html,application/xhtml+xml"},
                 timeout=timeout,
             )
             resp.raise_for_status()
             return resp.text
         except (requests.RequestException, requests.HTTPError) as e:
             last_err = e
+            if not _should_retry(e):
+                raise
             if attempt < retries - 1:
                 time.sleep(backoff ** attempt)
     raise last_err
@@ -52,32 +82,165 @@ def fetch_html(url: str, params: dict | None = None) -> str:
     return fetch_html_with_retry(url, params=params)
 
 
+_HTML_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, ".cache", "html")
+
+
+def fetch_html_cached(url: str, params: dict | None = None) -> str:
+    """fetch_html with a conditional-GET disk cache (ETag / Last-Modified).
+    Weekly runs hit the same pages; a 304 reuses the cached body and skips the
+    transfer. On network failure a cached copy, if any, is served stale so a
+    flaky source still yields last week's page. Single attempt, no retry loop —
+    the stale copy is the fallback. Raises only with no cache to fall back on."""
+    key = hashlib.sha1(f"{url}|{sorted(params.items()) if params else ''}".encode()).hexdigest()
+    body_path = os.path.join(_HTML_CACHE_DIR, f"{key}.html")
+    meta_path = os.path.join(_HTML_CACHE_DIR, f"{key}.json")
+    headers = {"Accept": "text/html,application/xhtml+xml"}
+    cached = os.path.isfile(body_path)
+    if cached:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        except (OSError, ValueError):
+            pass
+
+    def _read_cached() -> str:
+        with open(body_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    try:
+        resp = _session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 304 and cached:
+            return _read_cached()
+        resp.raise_for_status()
+    except (requests.RequestException, requests.HTTPError):
+        if cached:
+            return _read_cached()
+        raise
+    html = resp.text
+    try:
+        os.makedirs(_HTML_CACHE_DIR, exist_ok=True)
+        with open(body_path, "w", encoding="utf-8") as f:
+            f.write(html)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}, f)
+    except OSError:
+        pass  # cache is best-effort; the fetched page still gets returned
+    return html
+
+
 def requests_get_with_retry(
     url: str,
-    retries: int = REQUEST_RETRIES,
-    backoff: float = REQUEST_BACKOFF,
+    retries: int | None = None,
+    backoff: float | None = None,
     timeout: int = REQUEST_TIMEOUT,
     **kwargs,
 ) -> requests.Response:
-    """requests.get with retries and backoff. Raises on repeated failure."""
+    """requests.get with retries and backoff. Raises on repeated failure.
+    retries/backoff default to the module profile at call time, so aggregate
+    runs can tighten them for every scraper at once."""
+    retries = REQUEST_RETRIES if retries is None else retries
+    backoff = REQUEST_BACKOFF if backoff is None else backoff
     last_err = None
-    headers = kwargs.pop("headers", {})
-    headers.setdefault("User-Agent", USER_AGENT)
+    # User-Agent is a session default; callers can still override via headers=
     for attempt in range(retries):
         try:
-            r = requests.get(url, headers=headers, timeout=timeout, **kwargs)
+            r = _session.get(url, timeout=timeout, **kwargs)
             r.raise_for_status()
             return r
         except (requests.RequestException, requests.HTTPError) as e:
             last_err = e
+            if not _should_retry(e):
+                raise
             if attempt < retries - 1:
                 time.sleep(backoff ** attempt)
     raise last_err
 
 
-def parse_html(html: str, parser: str = "lxml") -> BeautifulSoup:
-    """Parse HTML string into BeautifulSoup."""
-    return BeautifulSoup(html, parser)
+def detect_csv_encoding(raw: bytes) -> str:
+    """Pick a decode encoding from a BOM check plus a UTF-8 trial on the first
+    64 KB, instead of letting callers re-parse a whole multi-MB CSV once per
+    candidate encoding. raw may be well under 64 KB (streaming callers pass a
+    peek() of whatever is buffered); either way the cut can land mid-multibyte,
+    so a decode error confined to the sample's last bytes still counts as UTF-8.
+    chardet refines the guess when installed (it is optional, not in
+    requirements.txt); otherwise non-UTF-8 gov.uk dumps are treated as Windows
+    (cp1252) exports."""
+    if raw[:3] == b"\xef\xbb\xbf":
+        return "utf-8-sig"
+    sample = raw[:65536]
+    try:
+        sample.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        # A UTF-8 sequence is at most 4 bytes; an error starting in the last 3
+        # bytes is a sequence truncated by the sample cut, not a non-UTF-8 file
+        if e.start >= len(sample) - 3:
+            return "utf-8"
+    try:
+        import chardet
+
+        enc = chardet.detect(sample).get("encoding")
+        if enc:
+            return enc
+    except ImportError:
+        pass
+    return "cp1252"
+
+
+def parse_html(html: str, parser: str = "lxml", parse_only=None) -> BeautifulSoup:
+    """Parse HTML string into BeautifulSoup. parse_only (a bs4 SoupStrainer)
+    restricts the tree to matching elements — faster and smaller when a caller
+    only needs e.g. anchors, but parent/sibling navigation won't work on it."""
+    return BeautifulSoup(html, parser, parse_only=parse_only)
+
+
+try:
+    from selectolax.parser import HTMLParser as _FastHTMLParser
+except ImportError:
+    _FastHTMLParser = None
+
+
+def parse_html_fast(html: str):
+    """Parse with selectolax (Lexbor C engine) when installed, else None.
+    Roughly an order of magnitude faster than BeautifulSoup; callers must keep a bs4 fallback."""
+    return _FastHTMLParser(html) if _FastHTMLParser else None
+
+
+try:
+    import lxml.html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+
+def parse_html_lxml(html: str):
+    """Parse into an lxml.html root (C XPath + C text extraction) when lxml is
+    installed, else None; callers must keep a bs4 fallback."""
+    if _lxml_html is None:
+        return None
+    try:
+        return _lxml_html.fromstring(html)
+    except Exception:
+        return None
+
+
+def iter_links(html: str):
+    """Yield (href, text) for every <a href> on the page, whitespace-normalized.
+    Goes through lxml.html directly (C tree walk + C text collection) instead of
+    building a BeautifulSoup and materializing find_all('a') — the link scans in
+    the news scrapers are the main consumers. Falls back to bs4."""
+    root = parse_html_lxml(html)
+    if root is not None:
+        for a in root.iter("a"):
+            href = a.get("href")
+            if href:
+                yield href, " ".join(a.text_content().split())
+        return
+    for a in BeautifulSoup(html, "lxml").find_all("a", href=True):
+        yield (a.get("href") or ""), " ".join(a.get_text().split())
 
 
 def save_results(
@@ -89,35 +252,91 @@ def save_results(
     json_file: bool = True,
     output_dir: str | None = None,
     date_suffix: str | None = None,
+    compress: bool = False,
 ) -> list[str]:
-    """Save scraped rows to output/ as CSV and/or JSON. date_suffix (e.g. 2025-02-03) for weekly runs."""
+    """Save scraped rows to output/ as CSV and/or JSON. date_suffix (e.g. 2025-02-03) for weekly runs.
+    compress=True writes .csv.gz/.json.gz (gzip level 1: ~5-10x smaller, near-zero write cost;
+    pandas.read_csv and gzip.open read them back directly). Off by default — the web app
+    serves the plain files."""
     import config as cfg
     out = (output_dir or getattr(cfg, "OUTPUT_DIR", None) or OUTPUT_DIR)
     Path(out).mkdir(parents=True, exist_ok=True)
-    saved = []
     safe_country = country.replace(" ", "_").lower()
     safe_source = source.replace(" ", "_").lower().replace("-", "_")
     base_name = f"bess_{safe_country}_{safe_source}"
     if date_suffix:
         base_name = f"{base_name}_{date_suffix}"
 
-    if csv and rows:
+    def _write_csv() -> str:
         path = os.path.join(out, f"{base_name}.csv")
-        df = pd.DataFrame(rows)
+        # Union of keys in first-seen order (rows from different branches can differ slightly)
+        fieldnames = list(rows[0].keys())
+        seen_keys = set(fieldnames)
+        for r in rows[1:]:
+            for k in r:
+                if k not in seen_keys:
+                    seen_keys.add(k)
+                    fieldnames.append(k)
+        if compress:
+            path += ".gz"
+            opener = gzip.open(path, "wt", compresslevel=1, newline="", encoding="utf-8-sig")
+        else:
+            opener = open(path, "w", newline="", encoding="utf-8-sig")
         # UTF-8 BOM so Excel opens with correct encoding; quote non-numeric so commas in text don't merge columns
-        df.to_csv(
-            path,
-            index=False,
-            encoding="utf-8-sig",
-            quoting=csv_module.QUOTE_NONNUMERIC,
-            date_format="%Y-%m-%dT%H:%M:%S",
-        )
-        saved.append(path)
+        with opener as f:
+            writer = csv_module.DictWriter(
+                f, fieldnames=fieldnames, restval="", quoting=csv_module.QUOTE_NONNUMERIC
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
 
-    if json_file and rows:
+    def _write_json() -> str:
         path = os.path.join(out, f"{base_name}.json")
-        with open(path, "w", encoding=DEFAULT_ENCODING) as f:
-            json.dump(rows, f, indent=2, ensure_ascii=False)
-        saved.append(path)
+        # Serialize in memory and write once: json.dump streams thousands of tiny writes
+        # through the file object, which dominates for multi-MB outputs.
+        # orjson (C encoder, emits bytes directly) when installed; stdlib otherwise.
+        if orjson is not None:
+            payload = orjson.dumps(rows, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            payload = json.dumps(rows, indent=2, ensure_ascii=False).encode(DEFAULT_ENCODING)
+        if compress:
+            path += ".gz"
+            with gzip.open(path, "wb", compresslevel=1) as f:
+                f.write(payload)
+        else:
+            with open(path, "wb", buffering=1024 * 1024) as f:
+                f.write(payload)
+        return path
+
+    def _write_parquet() -> str | None:
+        """Columnar twin for downstream analysis (typed, compressed, no per-row parse).
+        CSV/JSON stay canonical — the web app serves those. No-op without pyarrow."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            return None
+        path = os.path.join(out, f"{base_name}.parquet")
+        try:
+            pq.write_table(pa.Table.from_pylist(rows), path)
+        except Exception:
+            return None
+        return path
+
+    writers = []
+    if csv and rows:
+        writers.append(_write_csv)
+    if json_file and rows:
+        writers.append(_write_json)
+    if (csv or json_file) and rows:
+        # Twin of the enabled outputs — saving disabled entirely means no parquet either
+        writers.append(_write_parquet)
+    if len(writers) > 1:
+        # The serialization/IO of each format is independent; overlap them
+        with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+            saved = [future.result() for future in [executor.submit(w) for w in writers]]
+    else:
+        saved = [w() for w in writers]
 
-    return saved
+    return [p for p in saved if p]
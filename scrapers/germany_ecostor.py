@@ -3,8 +3,6 @@ Germany BESS projects scraper – ECO STOR Storage Monitor (MaStR-based).
 Large-scale battery storage >1 MW. Outputs sites and investment opportunity tags.
 """
 
-import re
-
 from .base import fetch_html, parse_html, save_results
 from config import SOURCES, INVESTMENT_OPPORTUNITY_MAP
 
@@ -22,12 +20,19 @@ def _opportunity_type(status: str) -> str:
 
 
 def _parse_number(text: str) -> str:
-    """Extract numeric value from cell text (e.g. '1.125' or '1.82')."""
+    """Extract numeric value from cell text (e.g. '1.125' or '1.82').
+    Plain character scan: cells are short and this runs per row, so regex overhead dominates."""
     if not text:
         return ""
     text = text.strip().replace(",", ".")
-    m = re.search(r"[\d.]+", text)
-    return m.group(0) if m else text.strip()
+    start = -1
+    for i, c in enumerate(text):
+        if c.isdigit() or c == ".":
+            if start < 0:
+                start = i
+        elif start >= 0:
+            return text[start:i]
+    return text[start:] if start >= 0 else text
 
 
 def scrape_germany_ecostor(
@@ -5,6 +5,7 @@ Produces a short report for weekly runs: counts by status, by opportunity type,
 
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from config import OUTPUT_DIR, DEFAULT_ENCODING, OUTPUT_UK_SUBDIR
 
@@ -12,38 +13,103 @@ from config import OUTPUT_DIR, DEFAULT_ENCODING, OUTPUT_UK_SUBDIR
 # Minimum projects to consider a run "complete" and append to summary (avoids recording partial runs)
 MIN_PROJECTS_FOR_SUMMARY = 50
 
+# Normalized status -> counter name: one dict.get per row instead of an elif chain
+_STATUS_COUNTER_KEY = {
+    "planned": "count_planned",
+    "consented": "count_consented",
+    "in-construction": "count_in_construction",
+    "operational": "count_operational",
+}
+
+
+@lru_cache(maxsize=256)
+def _opportunity_counter_key(opp: str) -> str | None:
+    """Counter name for an investment_opportunity phrase. Cached: the phrases come from
+    a small fixed map, so each distinct string is classified once per run."""
+    if "Early-stage" in opp:
+        return "count_early_stage_development"
+    if "Construction" in opp or "finance" in opp:
+        return "count_construction_finance"
+    if "M&A" in opp or "offtake" in opp:
+        return "count_ma_offtake"
+    return None
+
+
+def _count_rows_pandas(rows: list[dict]) -> dict | None:
+    """Vectorized status/opportunity counts and MW total via pandas. None if pandas is missing."""
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    df = pd.DataFrame(rows, columns=["status", "investment_opportunity", "capacity_mw_numeric"])
+    status = df["status"].fillna("").astype(str).str.strip().str.lower().str.replace(" ", "-", regex=False)
+    status_counts = status.value_counts()
+    opp = df["investment_opportunity"].fillna("").astype(str)
+    # Mirror the elif chain of the fallback loop: a row lands in exactly one bucket
+    early = opp.str.contains("Early-stage", regex=False)
+    constr = (opp.str.contains("Construction", regex=False) | opp.str.contains("finance", regex=False)) & ~early
+    ma = (opp.str.contains("M&A", regex=False) | opp.str.contains("offtake", regex=False)) & ~early & ~constr
+    total_mw = pd.to_numeric(df["capacity_mw_numeric"], errors="coerce").fillna(0.0).sum()
+    return {
+        "count_planned": int(status_counts.get("planned", 0)),
+        "count_consented": int(status_counts.get("consented", 0)),
+        "count_in_construction": int(status_counts.get("in-construction", 0)),
+        "count_operational": int(status_counts.get("operational", 0)),
+        "count_early_stage_development": int(early.sum()),
+        "count_construction_finance": int(constr.sum()),
+        "count_ma_offtake": int(ma.sum()),
+        "total_mw": float(total_mw),
+    }
+
 
 def build_investment_scope_summary(rows: list[dict], run_date: str | None = None, run_at: str | None = None) -> dict:
     """
     Build summary: counts by status, by investment_opportunity, total capacity_mw_numeric.
     Fixed columns for easy week-over-week comparison. run_at = one reading per run (ISO timestamp).
     """
-    count_planned = count_consented = count_in_construction = count_operational = 0
-    count_early_stage = count_construction_finance = count_ma_offtake = 0
-    total_mw = 0.0
-
-    for r in rows:
-        status = (r.get("status") or "").strip().lower().replace(" ", "-")
-        if status == "planned":
-            count_planned += 1
-        elif status == "consented":
-            count_consented += 1
-        elif status == "in-construction":
-            count_in_construction += 1
-        elif status == "operational":
-            count_operational += 1
-
-        opp = (r.get("investment_opportunity") or "").strip()
-        if "Early-stage" in opp:
-            count_early_stage += 1
-        elif "Construction" in opp or "finance" in opp:
-            count_construction_finance += 1
-        elif "M&A" in opp or "offtake" in opp:
-            count_ma_offtake += 1
-
-        cap = r.get("capacity_mw_numeric")
-        if cap is not None:
-            total_mw += float(cap)
+    counters = _count_rows_pandas(rows) if rows else None
+    if counters is not None:
+        count_planned = counters["count_planned"]
+        count_consented = counters["count_consented"]
+        count_in_construction = counters["count_in_construction"]
+        count_operational = counters["count_operational"]
+        count_early_stage = counters["count_early_stage_development"]
+        count_construction_finance = counters["count_construction_finance"]
+        count_ma_offtake = counters["count_ma_offtake"]
+        total_mw = counters["total_mw"]
+    else:
+        counts = {
+            "count_planned": 0,
+            "count_consented": 0,
+            "count_in_construction": 0,
+            "count_operational": 0,
+            "count_early_stage_development": 0,
+            "count_construction_finance": 0,
+            "count_ma_offtake": 0,
+        }
+        total_mw = 0.0
+
+        for r in rows:
+            status = (r.get("status") or "").strip().lower().replace(" ", "-")
+            status_key = _STATUS_COUNTER_KEY.get(status)
+            if status_key:
+                counts[status_key] += 1
+
+            opp_key = _opportunity_counter_key((r.get("investment_opportunity") or "").strip())
+            if opp_key:
+                counts[opp_key] += 1
+
+            cap = r.get("capacity_mw_numeric")
+            if cap is not None:
+                total_mw += float(cap)
+
+        count_planned = counts["count_planned"]
+        count_consented = counts["count_consented"]
+        count_in_construction = counts["count_in_construction"]
+        count_operational = counts["count_operational"]
+        count_early_stage = counts["count_early_stage_development"]
+        count_construction_finance = counts["count_construction_finance"]
+        count_ma_offtake = counts["count_ma_offtake"]
 
     now = datetime.now(timezone.utc)
     run_date = run_date or now.strftime("%Y-%m-%d")
@@ -63,6 +129,21 @@ def build_investment_scope_summary(rows: list[dict], run_date: str | None = None
     }
 
 
+def _mirror_summary_parquet(csv_path: str) -> None:
+    """Mirror the summary CSV to a .parquet twin for columnar consumers (typed, compressed).
+    The CSV stays canonical: the web app reads and serves it. No-op without pyarrow."""
+    try:
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+    except ImportError:
+        return
+    try:
+        table = pa_csv.read_csv(csv_path)
+        pq.write_table(table, csv_path[:-4] + ".parquet")
+    except Exception:
+        return
+
+
 def write_investment_scope_summary(
     rows: list[dict],
     output_dir: str | None = None,
@@ -103,4 +184,5 @@ def write_investment_scope_summary(
         if not file_exists:
             w.writeheader()
         w.writerow({k: summary[k] for k in fieldnames if k in summary})
+    _mirror_summary_parquet(path)
     return path
@@ -4,10 +4,22 @@ UK BESS – British Solar Renewables battery storage projects page.
 
 import re
 
-from .base import fetch_html, parse_html, save_results
+from bs4 import Tag
+
+from .base import fetch_html, parse_html, parse_html_fast, save_results
 from .uk_common import make_row, parse_capacity_mw
 from config import SOURCES
 
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "British Solar Renewables – UK Battery Storage",
+    "url": "https://britishrenewables.com/projects/battery-bess-projects",
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("british_renewables") or {}),
+}
+
+_RE_MW = re.compile(r"([\d.]+)\s*MW", re.IGNORECASE)
+
 
 def scrape_uk_british_renewables(
     save_csv: bool = True,
@@ -16,46 +28,27 @@ def scrape_uk_british_renewables(
 ) -> list[dict]:
     """Scrape British Renewables battery projects (Fareham, Fideoak, Stocking Pelham, etc.)."""
     try:
-        source = (SOURCES.get("uk") or {}).get("british_renewables") or {
-            "name": "British Solar Renewables – UK Battery Storage",
-            "url": "https://britishrenewables.com/projects/battery-bess-projects",
-            "country": "UK",
-        }
-        url = source.get("url", "")
-        country = source.get("country", "UK")
-        source_name = source.get("name", "British Solar Renewables")
+        url = _SRC["url"]
+        country = _SRC["country"]
+        source_name = _SRC["name"]
 
         html = fetch_html(url)
-        soup = parse_html(html)
         rows = []
         seen_names = set()
 
-        # Primary: h2 with "battery" (e.g. "Fareham Battery, Hampshire") and sibling with capacity
-        for h2 in soup.find_all(["h2", "h3"]):
-            text = (h2.get_text(strip=True) or "").strip()
-            if "battery" not in text.lower() and "bess" not in text.lower():
-                continue
+        def _add_heading_project(text: str, cap_text: str):
+            """Row from a heading like 'Fareham Battery, Hampshire' plus capacity text from its section."""
             name = text.replace("Our Battery Projects", "").replace("Battery Projects", "").strip()
             if not name or len(name) < 3:
-                continue
+                return
             region = ""
             if "," in name:
                 parts = name.split(",", 1)
                 name, region = parts[0].strip(), (parts[1].strip() if len(parts) > 1 else "")
-            cap_text = ""
-            for sib in h2.find_next_siblings():
-                if getattr(sib, "name", None) in ("h2", "h3"):
-                    break
-                t = sib.get_text() if hasattr(sib, "get_text") else str(sib)
-                if "capacity" in t.lower() or " MW" in t or "MWh" in t or "MW" in t:
-                    m = re.search(r"([\d.]+)\s*MW", t, re.IGNORECASE)
-                    if m:
-                        cap_text = m.group(0)
-                        break
             num = parse_capacity_mw(cap_text) if cap_text else None
             key = (name.lower(), num)
             if key in seen_names:
-                continue
+                return
             seen_names.add(key)
             rows.append(make_row(
                 site_name=name,
@@ -67,28 +60,78 @@ def scrape_uk_british_renewables(
                 status="Operational",
             ))
 
+        # Fast path: selectolax (C HTML engine) when installed — same headings-plus-siblings scan
+        tree = parse_html_fast(html)
+        if tree is not None:
+            for h in tree.css("h2, h3"):
+                text = (h.text(strip=True) or "").strip()
+                tlow = text.lower()
+                if "battery" not in tlow and "bess" not in tlow:
+                    continue
+                cap_text = ""
+                sib = h.next
+                while sib is not None and sib.tag not in ("h2", "h3"):
+                    t = sib.text() or ""
+                    if "capacity" in t.lower() or "MW" in t:
+                        m = _RE_MW.search(t)
+                        if m:
+                            cap_text = m.group(0)
+                            break
+                    sib = sib.next
+                _add_heading_project(text, cap_text)
+
+        # Primary (bs4): h2 with "battery" (e.g. "Fareham Battery, Hampshire") and sibling with capacity
+        soup = None
+        if not rows:
+            soup = parse_html(html)
+            for h2 in soup.find_all(["h2", "h3"]):
+                text = (h2.get_text(strip=True) or "").strip()
+                tlow = text.lower()
+                if "battery" not in tlow and "bess" not in tlow:
+                    continue
+                cap_text = ""
+                # Lazy sibling walk: find_next_siblings() materialises every following
+                # sibling per heading (O(N^2) across the page); next_siblings stops at break
+                for sib in h2.next_siblings:
+                    if not isinstance(sib, Tag):
+                        continue
+                    if sib.name in ("h2", "h3"):
+                        break
+                    t = sib.get_text()
+                    if "capacity" in t.lower() or " MW" in t or "MWh" in t or "MW" in t:
+                        m = _RE_MW.search(t)
+                        if m:
+                            cap_text = m.group(0)
+                            break
+                _add_heading_project(text, cap_text)
+
         # Fallback: any block with "MW" and battery-like name
         if not rows:
+            if soup is None:
+                soup = parse_html(html)
             for el in soup.find_all(["div", "section", "article"]):
                 t = (el.get_text() or "").strip()
-                if " MW" not in t or ("battery" not in t.lower() and "bess" not in t.lower()):
+                tlow = t.lower()
+                if " MW" not in t or ("battery" not in tlow and "bess" not in tlow):
                     continue
-                m = re.search(r"([\d.]+)\s*MW", t, re.IGNORECASE)
+                m = _RE_MW.search(t)
                 cap_text = m.group(0) if m else ""
+                cap_num = parse_capacity_mw(cap_text)
                 for h in el.find_all(["h2", "h3", "h4", "strong"]):
                     name = (h.get_text(strip=True) or "").strip()
                     if len(name) < 4 or len(name) > 120:
                         continue
-                    if (name.lower(), parse_capacity_mw(cap_text)) in seen_names:
+                    key = (name.lower(), cap_num)
+                    if key in seen_names:
                         continue
-                    seen_names.add((name.lower(), parse_capacity_mw(cap_text)))
+                    seen_names.add(key)
                     rows.append(make_row(
                         site_name=name,
                         source_name=source_name,
                         url=url,
                         region="",
                         capacity_mw=cap_text,
-                        capacity_mw_numeric=parse_capacity_mw(cap_text),
+                        capacity_mw_numeric=cap_num,
                         status="Operational",
                     ))
                     if len(rows) >= 20:
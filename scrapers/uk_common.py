@@ -5,16 +5,26 @@ Includes deduplication so the same project does not appear twice (e.g. REPD + de
 
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from config import INVESTMENT_OPPORTUNITY_MAP
 
+# Compiled once at import: these run per row/cell in the hot loops below
+_RE_WS = re.compile(r"\s+")
+_RE_TRAILING_PUNCT = re.compile(r"[.,;:\-]+$")
+_RE_C_PREFIX = re.compile(r"^c\.?\s*", re.IGNORECASE)
+# One alternation for both units so a single scan classifies the input
+_RE_CAPACITY = re.compile(r"([\d.]+)\s*([GM])W", re.IGNORECASE)
 
+
+@lru_cache(maxsize=8192)
 def _normalize_for_key(text: str, max_len: int = 200) -> str:
-    """Lowercase, strip, collapse whitespace, remove trailing punctuation."""
+    """Lowercase, strip, collapse whitespace, remove trailing punctuation.
+    Cached: the same site/region strings recur across sources during dedup."""
     if not text:
         return ""
-    s = re.sub(r"\s+", " ", str(text).strip().lower())
-    s = re.sub(r"[.,;:\-]+$", "", s)
+    s = _RE_WS.sub(" ", str(text).strip().lower())
+    s = _RE_TRAILING_PUNCT.sub("", s)
     return s[:max_len] if max_len else s
 
 
@@ -25,11 +35,13 @@ _DEDUP_GENERIC_SITE = frozenset({
 })
 
 
-def project_dedup_key(row: dict) -> tuple:
+def project_dedup_key(row: dict) -> str:
     """
-    Return a hashable key for deduplication: (site_normalized, capacity_rounded, region_normalized).
-    Same physical project from REPD and a developer page should get the same key.
-    If site is empty or generic, include normalized url so we don't merge unrelated rows.
+    Return a hashable key for deduplication: site_normalized + capacity_rounded + region_normalized,
+    NUL-joined into one string (a flat string hashes once and caches it; a tuple re-hashes
+    every element on each dict lookup). Same physical project from REPD and a developer
+    page should get the same key. If site is empty or generic, include normalized url so
+    we don't merge unrelated rows.
     """
     site = _normalize_for_key(row.get("site_name") or "", 200)
     cap = row.get("capacity_mw_numeric")
@@ -43,8 +55,8 @@ def project_dedup_key(row: dict) -> tuple:
     if not site or site in _DEDUP_GENERIC_SITE or len(site) < 3:
         url = (row.get("url") or "").strip().lower()
         url = url.split("?")[0].rstrip("/")[-120:] if url else ""
-        return (site or "_", cap, region, url)
-    return (site, cap, region)
+        return f"{site or '_'}\0{cap}\0{region}\0{url}"
+    return f"{site}\0{cap}\0{region}"
 
 
 def deduplicate_projects(rows: list[dict]) -> list[dict]:
@@ -55,11 +67,17 @@ def deduplicate_projects(rows: list[dict]) -> list[dict]:
     """
     if not rows:
         return []
-    seen: dict[tuple, dict] = {}
+    seen: dict[str, dict] = {}
+    copied: set[str] = set()
     for r in rows:
         key = project_dedup_key(r)
         if key in seen:
             existing = seen[key]
+            # Copy-on-collision: rows without duplicates (the common case) are
+            # never copied, only rows we are about to merge into
+            if key not in copied:
+                existing = seen[key] = dict(existing)
+                copied.add(key)
             src_a = (existing.get("source") or "").strip()
             src_b = (r.get("source") or "").strip()
             # Prefer non-News row as canonical; merge sources
@@ -72,7 +90,7 @@ def deduplicate_projects(rows: list[dict]) -> list[dict]:
                 if src_b and src_b not in src_a:
                     existing["source"] = f"{src_a}; {src_b}".strip("; ")
             continue
-        seen[key] = dict(r)
+        seen[key] = r
     return list(seen.values())
 
 # Map various source status phrases to our standard status
@@ -94,29 +112,34 @@ STATUS_NORMALISE = {
 }
 
 
+@lru_cache(maxsize=4096)
 def parse_capacity_mw(text: str) -> float | None:
-    """Parse capacity from text: '50MW', 'c.25MW', '1.45GW', '150MW / 300MWh'."""
+    """Parse capacity from text: '50MW', 'c.25MW', '1.45GW', '150MW / 300MWh'.
+    Cached: registers repeat the same capacity strings thousands of times."""
     if not text or not str(text).strip():
         return None
-    s = re.sub(r"^c\.?\s*", "", str(text).strip(), flags=re.IGNORECASE)
-    # GW first
-    m = re.search(r"([\d.]+)\s*GW", s, re.IGNORECASE)
-    if m:
-        try:
-            return float(m.group(1)) * 1000
-        except ValueError:
-            pass
-    m = re.search(r"([\d.]+)\s*MW", s, re.IGNORECASE)
-    if m:
+    s = str(text).strip()
+    # Drop the circa prefix so 'c.25MW' isn't read as '.25'
+    if s[:1] in ("c", "C"):
+        s = _RE_C_PREFIX.sub("", s)
+    # Single scan; GW still wins over an earlier MW figure
+    mw = None
+    for m in _RE_CAPACITY.finditer(s):
         try:
-            return float(m.group(1))
+            val = float(m.group(1))
         except ValueError:
-            return None
-    return None
+            continue
+        if m.group(2) in ("G", "g"):
+            return val * 1000
+        if mw is None:
+            mw = val
+    return mw
 
 
+@lru_cache(maxsize=4096)
 def normalise_status(raw: str) -> tuple[str, str]:
-    """Return (standard_status, investment_opportunity)."""
+    """Return (standard_status, investment_opportunity). Cached: status values
+    come from a vocabulary of a few dozen strings across every source."""
     key = (raw or "").strip().lower().replace(" ", "-").replace("_", "-")
     for k, standard in STATUS_NORMALISE.items():
         if k in key or key in k:
@@ -141,9 +164,13 @@ def make_row(
     capacity_mw: str = "",
     capacity_mw_numeric: float | None = None,
     status: str = "",
+    scraped_at: str | None = None,
 ) -> dict:
-    """Build a standard row dict. capacity_mw_numeric from capacity_mw if not provided."""
-    scraped_at = datetime.now(timezone.utc).isoformat()
+    """Build a standard row dict. capacity_mw_numeric from capacity_mw if not provided.
+    scraped_at lets callers stamp a whole batch with one timestamp instead of a fresh
+    datetime.now/isoformat per row."""
+    if scraped_at is None:
+        scraped_at = datetime.now(timezone.utc).isoformat()
     if capacity_mw_numeric is None and capacity_mw:
         capacity_mw_numeric = parse_capacity_mw(capacity_mw)
     std_status, opportunity = normalise_status(status)
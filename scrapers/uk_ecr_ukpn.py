@@ -3,10 +3,9 @@ UK BESS / Solar – UK Power Networks Embedded Capacity Register (ECR).
 Distribution-connected projects (1MW+ and under 1MW) in UKPN area.
 """
 
-import io
 import re
-
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 from .base import save_results, requests_get_with_retry
 from .uk_common import make_row, parse_capacity_mw
@@ -15,6 +14,13 @@ from config import SOURCES
 # UKPN OpenDataSoft – ECR 1MW and above (BESS/solar relevant)
 UKPN_ECR_API = "https://ukpowernetworks.opendatasoft.com/api/explore/v2.1/catalog/datasets/ukpn-embedded-capacity-register/records"
 UKPN_ECR_CSV = "https://ukpowernetworks.opendatasoft.com/api/explore/v2.1/catalog/datasets/ukpn-embedded-capacity-register/exports/csv"
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "UK Power Networks – Embedded Capacity Register (ECR)",
+    "url": "https://ukpowernetworks.opendatasoft.com/explore/dataset/ukpn-embedded-capacity-register",
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("ecr_ukpn") or {}),
+}
 REQUEST_TIMEOUT = 60
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -22,86 +28,184 @@ USER_AGENT = (
 )
 
 
-def _fetch_ukpn_ecr() -> list[dict]:
-    """Fetch UKPN ECR records (CSV or API). Returns list of record dicts."""
-    # Try CSV export first (simplest)
+# Chunk size for streaming the CSV export: bounds peak memory by chunk, not register size
+_ECR_CHUNK_ROWS = 50_000
+
+
+def _fetch_ukpn_ecr_chunks() -> "pd.io.parsers.TextFileReader | None":
+    """Stream the ECR CSV export, parsed in chunks of _ECR_CHUNK_ROWS rows.
+    stream=True + read_csv(r.raw) avoids buffering the whole body as bytes before
+    parsing; network I/O overlaps with the parse. None on failure."""
     try:
-        r = requests_get_with_retry(UKPN_ECR_CSV, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT}, params={"limit": -1})
-        df = pd.read_csv(io.BytesIO(r.content), encoding="utf-8", low_memory=False)
-        return df.to_dict("records")
+        import pandas as pd  # deferred: keeps module import (and cold start) pandas-free
+
+        r = requests_get_with_retry(
+            UKPN_ECR_CSV,
+            timeout=REQUEST_TIMEOUT,
+            headers={"User-Agent": USER_AGENT},
+            params={"limit": -1},
+            stream=True,
+        )
+        r.raw.decode_content = True  # transparently inflate gzip/deflate bodies
+        return pd.read_csv(r.raw, encoding="utf-8", chunksize=_ECR_CHUNK_ROWS)
     except Exception:
-        pass
-    # Try JSON API with pagination
+        return None
+
+
+def _unwrap_ods_results(results: list) -> list[dict]:
+    """Unwrap OpenDataSoft records ('record' with 'fields') into plain dicts."""
+    out = []
+    for rec in results:
+        fields = rec.get("record", {}).get("fields", rec) if isinstance(rec.get("record"), dict) else rec
+        out.append(fields if isinstance(fields, dict) else rec)
+    return out
+
+
+def _fetch_ukpn_ecr_api() -> list[dict]:
+    """Fetch ECR records from the JSON API. The first page reports total_count, so the
+    remaining pages (pure round-trip latency) are fetched concurrently and merged
+    in offset order. Returns list of record dicts."""
+    limit = 100
+    max_offset = 10_000
+
+    def _page(offset: int) -> list[dict]:
+        r = requests_get_with_retry(
+            UKPN_ECR_API,
+            timeout=REQUEST_TIMEOUT,
+            headers={"User-Agent": USER_AGENT},
+            params={"limit": limit, "offset": offset},
+        )
+        return _unwrap_ods_results(r.json().get("results", []))
+
     try:
-        all_records = []
-        start = 0
-        limit = 100
-        while True:
-            r = requests_get_with_retry(
-                UKPN_ECR_API,
-                timeout=REQUEST_TIMEOUT,
-                headers={"User-Agent": USER_AGENT},
-                params={"limit": limit, "offset": start},
-            )
-            data = r.json()
-            results = data.get("results", [])
-            if not results:
-                break
-            for rec in results:
-                # OpenDataSoft wraps in 'record' with 'fields'
-                fields = rec.get("record", {}).get("fields", rec) if isinstance(rec.get("record"), dict) else rec
-                if isinstance(fields, dict):
-                    all_records.append(fields)
-                else:
-                    all_records.append(rec)
-            if len(results) < limit:
-                break
-            start += limit
-            if start > 10000:
-                break
+        r = requests_get_with_retry(
+            UKPN_ECR_API,
+            timeout=REQUEST_TIMEOUT,
+            headers={"User-Agent": USER_AGENT},
+            params={"limit": limit, "offset": 0},
+        )
+        data = r.json()
+        results = data.get("results", [])
+        if not results:
+            return []
+        all_records = _unwrap_ods_results(results)
+        total = int(data.get("total_count") or len(results))
+        if total > limit:
+            offsets = range(limit, min(total, max_offset), limit)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for page in executor.map(_page, offsets):
+                    all_records.extend(page)
         return all_records
     except Exception:
         pass
     return []
 
 
-def _find_col(record: dict, *keywords) -> str | None:
-    """Return first key in record that contains all keywords (case-insensitive)."""
-    keys = [k for k in record if isinstance(k, str)]
-    for k in keys:
-        lower = k.lower()
+def _build_col_index(keys) -> dict[str, str]:
+    """Lowercased key -> original key, computed once per schema (columns are scanned
+    several times with different keyword sets; lowercase each key only once)."""
+    return {k.lower(): k for k in keys if isinstance(k, str)}
+
+
+def _find_col(idx: dict[str, str], *keywords) -> str | None:
+    """Return first original key whose lowercase form contains all keywords."""
+    for lower, orig in idx.items():
         if all(w in lower for w in keywords):
-            return k
+            return orig
     return None
 
 
+def _rows_from_ecr_df(df: "pd.DataFrame", source_name: str, url: str, seen: set) -> list[dict]:
+    """Build standard rows straight from DataFrame columns.
+    Avoids to_dict('records'), which explodes the frame into N x cols Python objects
+    just to iterate them once; only the three needed columns are materialized."""
+    import pandas as pd
+
+    idx = _build_col_index(str(c) for c in df.columns)
+    name_col = _find_col(idx, "site") or _find_col(idx, "name") or _find_col(idx, "project") or _find_col(idx, "customer")
+    cap_col = _find_col(idx, "capacity") or _find_col(idx, "mw") or _find_col(idx, "export")
+    region_col = _find_col(idx, "region") or _find_col(idx, "primary") or _find_col(idx, "substation")
+
+    empty = pd.Series("", index=df.index)
+    names = df[name_col].astype(str).str.strip().tolist() if name_col else empty.tolist()
+    if cap_col:
+        # One C-loop cast for the whole column; only the stragglers it can't
+        # coerce (e.g. '49.9 MW') go through the Python text parser
+        cap_series = pd.to_numeric(df[cap_col], errors="coerce")
+        needs_parse = cap_series.isna() & df[cap_col].notna()
+        if needs_parse.any():
+            cap_series[needs_parse] = df.loc[needs_parse, cap_col].astype(str).map(parse_capacity_mw)
+        cap_nums = cap_series.tolist()
+    else:
+        cap_nums = [None] * len(df)
+    regions = df[region_col].astype(str).str.strip().tolist() if region_col else empty.tolist()
+
+    rows = []
+    scraped_at = datetime.now(timezone.utc).isoformat()  # one stamp for the batch
+    for name, cap_num, region in zip(names, cap_nums, regions):
+        if not name or name == "nan":
+            continue
+        if cap_num is not None and cap_num != cap_num:  # residual NaN -> None
+            cap_num = None
+        key = (name.lower(), cap_num)
+        if key in seen:
+            continue
+        seen.add(key)
+        capacity_mw = f"{cap_num} MW" if cap_num is not None else ""
+        if region == "nan":
+            region = ""
+        rows.append(make_row(
+            site_name=name,
+            source_name=source_name,
+            url=url,
+            region=region,
+            capacity_mw=capacity_mw,
+            capacity_mw_numeric=cap_num,
+            # ECR = distribution connection; treat as Consented/Operational depending on data
+            status="Consented",
+            scraped_at=scraped_at,
+        ))
+    return rows
+
+
 def scrape_uk_ecr_ukpn(
     save_csv: bool = True,
     save_json: bool = True,
     date_suffix: str | None = None,
 ) -> list[dict]:
     """Scrape UKPN Embedded Capacity Register. Returns list of standard rows."""
-    source = SOURCES["uk"].get("ecr_ukpn") or {
-        "name": "UK Power Networks – Embedded Capacity Register (ECR)",
-        "url": "https://ukpowernetworks.opendatasoft.com/explore/dataset/ukpn-embedded-capacity-register",
-        "country": "UK",
-    }
-    country = source["country"]
-    source_name = source["name"]
-
-    records = _fetch_ukpn_ecr()
+    country = _SRC["country"]
+    source_name = _SRC["name"]
+
+    # Columnar path: CSV export is streamed and parsed chunk by chunk
+    reader = _fetch_ukpn_ecr_chunks()
+    if reader is not None:
+        rows = []
+        seen: set = set()
+        try:
+            for chunk in reader:
+                rows.extend(_rows_from_ecr_df(chunk, source_name, _SRC["url"], seen))
+        except Exception:
+            rows = []  # stream/parse died mid-way; fall through to the JSON API
+        if rows:
+            save_results(rows, country, "ecr_ukpn", csv=save_csv, json_file=save_json, date_suffix=date_suffix)
+            return rows
+
+    # Fallback: JSON API records (per-row dicts)
+    records = _fetch_ukpn_ecr_api()
     if not records:
         return []
 
     # Infer column names from first record
-    sample = records[0]
-    name_col = _find_col(sample, "site") or _find_col(sample, "name") or _find_col(sample, "project") or _find_col(sample, "customer")
-    cap_col = _find_col(sample, "capacity") or _find_col(sample, "mw") or _find_col(sample, "export")
-    tech_col = _find_col(sample, "technology") or _find_col(sample, "type") or _find_col(sample, "energy")
-    region_col = _find_col(sample, "region") or _find_col(sample, "primary") or _find_col(sample, "substation")
+    idx = _build_col_index(records[0])
+    name_col = _find_col(idx, "site") or _find_col(idx, "name") or _find_col(idx, "project") or _find_col(idx, "customer")
+    cap_col = _find_col(idx, "capacity") or _find_col(idx, "mw") or _find_col(idx, "export")
+    tech_col = _find_col(idx, "technology") or _find_col(idx, "type") or _find_col(idx, "energy")
+    region_col = _find_col(idx, "region") or _find_col(idx, "primary") or _find_col(idx, "substation")
 
     rows = []
     seen = set()
+    scraped_at = datetime.now(timezone.utc).isoformat()  # one stamp for the batch
     for rec in records:
         name = ""
         if name_col and name_col in rec:
@@ -126,11 +230,12 @@ def scrape_uk_ecr_ukpn(
         row = make_row(
             site_name=name,
             source_name=source_name,
-            url=source.get("url") or UKPN_ECR_CSV,
+            url=_SRC["url"],
             region=region,
             capacity_mw=capacity_mw,
             capacity_mw_numeric=capacity_mw_numeric,
             status=status,
+            scraped_at=scraped_at,
         )
         rows.append(row)
 
@@ -4,16 +4,24 @@ Latest projects only; outputs sites and investment scope for Elements Green (Lon
 Designed for weekly runs.
 """
 
-import re
 from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse
 
-from .base import fetch_html, parse_html, save_results
+from .base import fetch_html, iter_links, parse_html, parse_html_lxml, save_results
 from config import SOURCES, INVESTMENT_OPPORTUNITY_MAP
 
 # Statuses that represent "latest" / investment pipeline (exclude operational for pipeline focus)
 LATEST_STATUSES = {"planned", "consented", "in-construction"}
 
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "EDF Renewables UK & Ireland – Battery Storage",
+    "url": "https://www.edf-re.uk/our-sites/?view=list&project_types=battery-storage",
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("edf_re_uk") or {}),
+}
+
+
 
 def _opportunity_type(status: str) -> str:
     """Map project status to investment opportunity type."""
@@ -22,16 +30,29 @@ def _opportunity_type(status: str) -> str:
 
 
 def _parse_capacity_mw(capacity: str) -> float | None:
-    """Parse capacity string (e.g. '50MW', 'c.25MW', '47.5MW') to numeric MW."""
+    """Parse capacity string (e.g. '50MW', 'c.25MW', '47.5MW') to numeric MW.
+    Plain find + walk-back instead of a regex: the cells are a few characters
+    and this runs once per table row, so engine setup is the whole cost."""
     if not capacity or not capacity.strip():
         return None
-    s = re.sub(r"^c\.?\s*", "", capacity.strip(), flags=re.IGNORECASE)
-    m = re.search(r"([\d.]+)\s*MW", s, re.IGNORECASE)
-    if m:
-        try:
-            return float(m.group(1))
-        except ValueError:
-            return None
+    s = capacity.strip()
+    if s[:1] in ("c", "C"):  # circa prefix, e.g. 'c.25MW'
+        s = s[1:].lstrip(".").lstrip()
+    upper = s.upper()
+    i = upper.find("MW")
+    while i != -1:
+        j = i
+        while j > 0 and s[j - 1].isspace():
+            j -= 1
+        k = j
+        while k > 0 and (s[k - 1].isdigit() or s[k - 1] == "."):
+            k -= 1
+        if k < j:
+            try:
+                return float(s[k:j])
+            except ValueError:
+                return None
+        i = upper.find("MW", i + 2)
     return None
 
 
@@ -47,73 +68,95 @@ def scrape_uk_edf_bess(
     latest_only: if True, keep only Planned / Consented / In-construction (pipeline focus).
     """
     try:
-        source = (SOURCES.get("uk") or {}).get("edf_re_uk") or {
-            "name": "EDF Renewables UK & Ireland – Battery Storage",
-            "url": "https://www.edf-re.uk/our-sites/?view=list&project_types=battery-storage",
-            "country": "UK",
-        }
-        url = source.get("url", "")
-        country = source.get("country", "UK")
-        source_name = source.get("name", "EDF Renewables UK & Ireland")
+        url = _SRC["url"]
+        country = _SRC["country"]
+        source_name = _SRC["name"]
         scraped_at = datetime.now(timezone.utc).isoformat()
-        base_url = urlparse(url).scheme + "://" + urlparse(url).netloc if url else ""
+        parts = urlparse(url) if url else None
+        base_url = f"{parts.scheme}://{parts.netloc}" if parts else ""
+
+        def _full_url(href: str) -> str:
+            """Absolute project URL. Root-relative hrefs (the common case) take a plain
+            concat; urljoin's RFC machinery only runs for the odd relative path."""
+            if not href:
+                return url
+            if href.startswith("http"):
+                return href
+            if href.startswith("/"):
+                return base_url + href
+            return urljoin(base_url, href)
 
         html = fetch_html(url)
-        soup = parse_html(html)
 
-        rows = []
-        table = soup.find("table")
-        if table:
+        def _iter_table_rows():
+            """Yield (site_name, href, cell_texts) per table row. lxml pulls each
+            row's cells out in one C call when installed; bs4 walk otherwise."""
+            tree = parse_html_lxml(html)
+            if tree is not None:
+                for tr in tree.xpath("//table//tr"):
+                    tds = tr.xpath("./td")
+                    if len(tds) < 2:
+                        continue
+                    texts = [td.text_content().strip() for td in tds]
+                    links = tds[0].xpath(".//a")
+                    href = (links[0].get("href") or "") if links else ""
+                    site = " ".join(links[0].text_content().split()) if links else texts[0]
+                    yield site, href, texts
+                return
+            table = parse_html(html).find("table")
+            if not table:
+                return
             tbody = table.find("tbody") or table
             for tr in tbody.find_all("tr"):
                 cells = tr.find_all("td")
                 if len(cells) < 2:
                     continue
-                site_cell = cells[0]
-                link = site_cell.find("a")
-                site_name = (link.get_text(strip=True) if link else site_cell.get_text(strip=True)) or ""
+                texts = [c.get_text(strip=True) for c in cells]
+                link = cells[0].find("a")
                 href = link.get("href", "") if link else ""
-                project_url = urljoin(base_url, href) if href else url
-
-                status = ""
-                country_val = country
-                capacity = ""
-                if len(cells) >= 2:
-                    status = cells[1].get_text(strip=True)
-                if len(cells) >= 4:
-                    country_val = cells[3].get_text(strip=True) or country
-                if len(cells) >= 5:
-                    capacity = cells[4].get_text(strip=True) or ""
-
-                status_key = (status or "").strip().lower().replace(" ", "-")
-                if latest_only and status_key not in LATEST_STATUSES:
-                    continue
+                site = (link.get_text(strip=True) if link else texts[0]) or ""
+                yield site, href, texts
 
-                opportunity = _opportunity_type(status)
-                capacity_numeric = _parse_capacity_mw(capacity)
-                rows.append({
-                    "scraped_at": scraped_at,
-                    "country": "UK",
-                    "region": country_val,
-                    "site_name": site_name,
-                    "capacity_mw": capacity,
-                    "capacity_mw_numeric": capacity_numeric,
-                    "status": status,
-                    "investment_opportunity": opportunity,
-                    "source": source_name,
-                    "url": project_url,
-                })
-        if not table:
-            for a in soup.select('a[href*="/our-sites/"]'):
+        rows = []
+        for site_name, href, cells in _iter_table_rows():
+            project_url = _full_url(href)
+
+            status = cells[1]
+            country_val = country
+            capacity = ""
+            if len(cells) >= 4:
+                country_val = cells[3] or country
+            if len(cells) >= 5:
+                capacity = cells[4] or ""
+
+            status_key = (status or "").strip().lower().replace(" ", "-")
+            if latest_only and status_key not in LATEST_STATUSES:
+                continue
+
+            opportunity = _opportunity_type(status)
+            capacity_numeric = _parse_capacity_mw(capacity)
+            rows.append({
+                "scraped_at": scraped_at,
+                "country": "UK",
+                "region": country_val,
+                "site_name": site_name,
+                "capacity_mw": capacity,
+                "capacity_mw_numeric": capacity_numeric,
+                "status": status,
+                "investment_opportunity": opportunity,
+                "source": source_name,
+                "url": project_url,
+            })
+        if not rows:
+            # C-level link walk; the href filter replaces the old a[href*="/our-sites/"] select
+            for href, site_name in iter_links(html):
                 if latest_only:
                     continue
-                href = a.get("href", "")
-                if href.count("/") < 4:
+                if "/our-sites/" not in href or href.count("/") < 4:
                     continue
-                site_name = (a.get_text(strip=True) or "").strip()
                 if not site_name or len(site_name) > 200:
                     continue
-                project_url = urljoin(base_url, href) if href else url
+                project_url = _full_url(href)
                 rows.append({
                     "scraped_at": scraped_at,
                     "country": "UK",
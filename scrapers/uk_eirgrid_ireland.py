@@ -5,11 +5,12 @@ Lists are published as PDFs; this scraper records the source URLs and link text
 
 from urllib.parse import urljoin
 
-from .base import fetch_html, parse_html, save_results
+from .base import fetch_html, iter_links, save_results
 from .uk_common import make_row
 from config import SOURCES
 
 EIRGRID_URL = "https://www.eirgrid.ie/industry/customer-information/connected-and-contracted-generators"
+EIRGRID_BASE = "https://www.eirgrid.ie"
 REQUEST_TIMEOUT = 30
 
 
@@ -39,17 +40,23 @@ def scrape_eirgrid_ireland(
     rows = []
     try:
         html = fetch_html(EIRGRID_URL)
-        soup = parse_html(html)
-        for a in soup.find_all("a", href=True):
-            href = (a.get("href") or "").strip()
+        # C-level link walk instead of soup + find_all('a')
+        for href, text in iter_links(html):
+            href = href.strip()
             if not href or href.startswith("#"):
                 continue
-            text = (a.get_text(strip=True) or "").strip()
-            if not text or len(text) < 5:
-                continue
-            # Focus on PDFs and generator/list links
-            if ".pdf" in href.lower() or "contract" in href.lower() or "connect" in href.lower() or "generator" in href.lower():
-                url = href if href.startswith("http") else urljoin(EIRGRID_URL, href)
+            # Focus on PDFs and generator/list links (href filter before the text one:
+            # it rejects most links, lowercase once, not per keyword)
+            hlow = href.lower()
+            if ".pdf" in hlow or "contract" in hlow or "connect" in hlow or "generator" in hlow:
+                if not text or len(text) < 5:
+                    continue
+                if href.startswith("http"):
+                    url = href
+                elif href.startswith("/"):  # root-relative: plain concat beats urljoin
+                    url = EIRGRID_BASE + href
+                else:
+                    url = urljoin(EIRGRID_URL, href)
                 row = make_row(
                     site_name=text[:200],
                     source_name=source_name,
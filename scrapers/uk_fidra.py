@@ -4,10 +4,27 @@ UK BESS – Fidra Energy our-projects (Thorpe Marsh, West Burton C, Bicker Fen).
 
 import re
 
+from bs4 import Tag
+
 from .base import fetch_html, parse_html, save_results
 from .uk_common import make_row, parse_capacity_mw
 from config import SOURCES
 
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "Fidra Energy – UK Energy Storage",
+    "url": "https://fidraenergy.com/our-projects/",
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("fidra_energy") or {}),
+}
+
+_HEADING_NAMES = frozenset({"h1", "h2", "h3", "h4"})
+
+# Compiled once at import: these run per heading/sibling in the scan below
+_RE_TRAILING_STARS = re.compile(r"\s*\*\*$")
+_RE_CAP_UNIT = re.compile(r"([\d.]+)\s*(GW|MW|GWh|MWh)", re.IGNORECASE)
+_RE_CAP_GW_MW = re.compile(r"([\d.]+)\s*(GW|MW)", re.IGNORECASE)
+
 
 def scrape_uk_fidra(
     save_csv: bool = True,
@@ -16,10 +33,9 @@ def scrape_uk_fidra(
 ) -> list[dict]:
     """Scrape Fidra Energy UK BESS projects."""
     try:
-        source = (SOURCES.get("uk") or {}).get("fidra_energy") or {"name": "Fidra Energy – UK Energy Storage", "url": "https://fidraenergy.com/our-projects/", "country": "UK"}
-        url = source.get("url", "")
-        country = source.get("country", "UK")
-        source_name = source.get("name", "Fidra Energy")
+        url = _SRC["url"]
+        country = _SRC["country"]
+        source_name = _SRC["name"]
 
         html = fetch_html(url)
         soup = parse_html(html)
@@ -31,23 +47,27 @@ def scrape_uk_fidra(
             text = (h.get_text(strip=True) or "").strip()
             if not text or len(text) < 3:
                 continue
-            name = re.sub(r"\s*\*\*$", "", text.replace("**", "").strip())
+            name = _RE_TRAILING_STARS.sub("", text.replace("**", "").strip())
             if not name or len(name) > 120:
                 continue
             region = ""
             cap_str = ""
-            for sib in h.find_next_siblings():
-                if getattr(sib, "name", None) in ("h1", "h2", "h3", "h4"):
+            # Lazy walk: find_next_siblings() materialises every following sibling
+            # per heading (quadratic across the page); next_siblings stops at break
+            for sib in h.next_siblings:
+                if not isinstance(sib, Tag):
+                    continue
+                if sib.name in _HEADING_NAMES:
                     break
-                t = sib.get_text() if hasattr(sib, "get_text") else ""
+                t = sib.get_text()
                 if "Size:" in t or "GW" in t or "MW" in t or "GWh" in t:
-                    m = re.search(r"([\d.]+)\s*(GW|MW|GWh|MWh)", t, re.IGNORECASE)
+                    m = _RE_CAP_UNIT.search(t)
                     if m:
                         cap_str = m.group(0)
                 if "Location:" in t:
                     region = t.replace("Location:", "").strip().split("\n")[0].strip()[:80]
             num = parse_capacity_mw(cap_str) if cap_str else None
-            key = name.lower()[:60]
+            key = name[:60].lower()  # slice first: only 60 chars get lowercased
             if key in seen:
                 continue
             seen.add(key)
@@ -64,14 +84,14 @@ def scrape_uk_fidra(
         # Fallback: any text block with "GW" or "MW" and a short heading-like line
         if not rows:
             for el in soup.find_all(["div", "section"]):
-                t = el.get_text() if hasattr(el, "get_text") else ""
+                t = el.get_text()  # find_all only yields Tags; no hasattr guard needed
                 if "Thorpe" not in t and "West Burton" not in t and "Bicker" not in t and "storage" not in t.lower():
                     continue
-                m = re.search(r"([\d.]+)\s*(GW|MW)", t, re.IGNORECASE)
+                m = _RE_CAP_GW_MW.search(t)
                 cap_str = m.group(0) if m else ""
                 for h in el.find_all(["h2", "h3", "strong"]):
                     name = (h.get_text(strip=True) or "").strip()
-                    key = name.lower()[:60]
+                    key = name[:60].lower()
                     if 3 <= len(name) <= 80 and key not in seen:
                         seen.add(key)
                         rows.append(make_row(
@@ -5,8 +5,9 @@ Outputs article titles, dates, URLs as rows for latest opportunity signals.
 
 import re
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
-from .base import fetch_html, parse_html, save_results
+from .base import fetch_html_cached, iter_links, save_results
 from .uk_common import make_row, parse_capacity_mw
 from config import SOURCES
 
@@ -15,6 +16,23 @@ NEWS_URL = "https://www.energy-storage.news/category/news/"
 MAX_ARTICLES = 30
 UK_KEYWORDS = ("uk", "britain", "british", "england", "scotland", "wales", "ireland")
 
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "Energy-Storage.news – UK BESS news",
+    "url": NEWS_URL,
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("energy_storage_news") or {}),
+}
+# One alternation scan instead of seven independent substring passes per headline
+_UK_KW_RE = re.compile("|".join(map(re.escape, UK_KEYWORDS)))
+
+# Compiled once at import: runs per headline in the link scan
+_RE_CAPACITY = re.compile(r"[\d.]+\s*MW|[\d.]+\s*GWh|[\d.]+\s*MWh", re.IGNORECASE)
+# Cheap probe: most headlines have no digit at all, so skip the regex for those
+_DIGITS = frozenset("0123456789")
+# Non-article path prefixes; one split + set lookup replaces five substring scans per link
+_BAD_SEGMENTS = frozenset({"category", "newsletter", "premium", "tag", "author"})
+
 
 def scrape_uk_news_energy_storage(
     save_csv: bool = True,
@@ -24,42 +42,46 @@ def scrape_uk_news_energy_storage(
 ) -> list[dict]:
     """Scrape Energy-Storage.news for latest articles. If uk_only, keep only UK-relevant headlines."""
     try:
-        source = (SOURCES.get("uk") or {}).get("energy_storage_news") or {"name": "Energy-Storage.news – UK BESS news", "url": NEWS_URL, "country": "UK"}
-        country = source.get("country", "UK")
-        source_name = source.get("name", "Energy-Storage.news")
+        country = _SRC["country"]
+        source_name = _SRC["name"]
 
         try:
-            html = fetch_html(NEWS_URL)
+            html = fetch_html_cached(NEWS_URL)
         except Exception:
-            html = fetch_html(BASE_URL)
-        soup = parse_html(html)
+            html = fetch_html_cached(BASE_URL)
+        # One C-level pass collects every (href, text) pair; both scans below reuse it
+        links = list(iter_links(html))
         rows = []
         scraped_at = datetime.now(timezone.utc).isoformat()
         seen_hrefs = set()
 
         # Articles: links to article pages (exclude nav, category, newsletter)
-        for a in soup.find_all("a", href=True):
-            href = (a.get("href") or "").strip()
-            if not href or href in seen_hrefs:
+        for href, title in links:
+            href = href.strip()
+            if not href:
+                continue
+            parts = urlsplit(href)
+            if "energy-storage.news" not in parts.netloc:
                 continue
-            if "energy-storage.news" not in href:
+            # Dedup on the path so query/fragment variants of one article collapse
+            if parts.path in seen_hrefs:
                 continue
-            if "/category/" in href or "/newsletter/" in href or "/premium/" in href or "/tag/" in href or "/author/" in href:
+            seg = parts.path.split("/", 2)
+            if len(seg) > 1 and seg[1] in _BAD_SEGMENTS:
                 continue
             if href.count("/") < 4:
                 continue
-            title = (a.get_text(strip=True) or "").strip()
             if len(title) < 12 or len(title) > 300:
                 continue
-            seen_hrefs.add(href)
+            seen_hrefs.add(parts.path)
             if uk_only:
-                t_lower = title.lower()
-                if not any(k in t_lower for k in UK_KEYWORDS):
+                if not _UK_KW_RE.search(title.lower()):
                     continue
             cap_str = ""
-            m = re.search(r"[\d.]+\s*MW|[\d.]+\s*GWh|[\d.]+\s*MWh", title, re.IGNORECASE)
-            if m:
-                cap_str = m.group(0)
+            if _DIGITS.intersection(title):
+                m = _RE_CAPACITY.search(title)
+                if m:
+                    cap_str = m.group(0)
             cap_num = parse_capacity_mw(cap_str) if cap_str else None
             row = make_row(
                 site_name=title,
@@ -68,25 +90,26 @@ def scrape_uk_news_energy_storage(
                 capacity_mw=cap_str,
                 capacity_mw_numeric=cap_num,
                 status="News",
+                scraped_at=scraped_at,
             )
-            row["scraped_at"] = scraped_at
             rows.append(row)
             if len(rows) >= MAX_ARTICLES:
                 break
 
         # Fallback: any link with long-enough text that looks like a headline
         if not rows:
-            for a in soup.find_all("a", href=True):
-                href = (a.get("href") or "").strip()
+            for href, title in links:
+                href = href.strip()
                 if "energy-storage.news" not in href or "/category/" in href or "/newsletter/" in href:
                     continue
-                title = (a.get_text(strip=True) or "").strip()
-                if 15 <= len(title) <= 280 and ("storage" in title.lower() or "battery" in title.lower() or "MW" in title or "GWh" in title):
+                t_lower = title.lower()
+                if 15 <= len(title) <= 280 and ("storage" in t_lower or "battery" in t_lower or "MW" in title or "GWh" in title):
                     full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
                     cap_str = ""
-                    m = re.search(r"[\d.]+\s*MW|[\d.]+\s*GWh|[\d.]+\s*MWh", title, re.IGNORECASE)
-                    if m:
-                        cap_str = m.group(0)
+                    if _DIGITS.intersection(title):
+                        m = _RE_CAPACITY.search(title)
+                        if m:
+                            cap_str = m.group(0)
                     rows.append(make_row(
                         site_name=title,
                         source_name=source_name,
@@ -94,6 +117,7 @@ def scrape_uk_news_energy_storage(
                         capacity_mw=cap_str,
                         capacity_mw_numeric=parse_capacity_mw(cap_str) if cap_str else None,
                         status="News",
+                        scraped_at=scraped_at,
                     ))
                     if len(rows) >= MAX_ARTICLES:
                         break
@@ -4,8 +4,9 @@ UK BESS / Solar – Solar Power Portal latest headlines (UK solar & storage news
 
 import re
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
-from .base import fetch_html, parse_html, save_results
+from .base import fetch_html_cached, iter_links, save_results
 from .uk_common import make_row, parse_capacity_mw
 from config import SOURCES
 
@@ -19,6 +20,23 @@ BATTERY_SECTIONS = [
 ]
 MAX_ARTICLES = 25
 
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "Solar Power Portal – UK battery storage",
+    "url": BASE_URL,
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("solar_power_portal") or {}),
+}
+
+# Compiled once at import: runs per headline in the link scan
+_RE_CAPACITY = re.compile(r"[\d.]+\s*MW|[\d.]+\s*GW|[\d.]+\s*MWh", re.IGNORECASE)
+# Cheap probe: most headlines have no digit at all, so skip the regex for those
+_DIGITS = frozenset("0123456789")
+# Non-article path prefixes; one split + set lookup replaces four substring scans per link
+_BAD_SEGMENTS = frozenset({"tag", "author", "page", "category"})
+# One alternation scan instead of eight independent substring passes per headline
+_TOPIC_KW_RE = re.compile("|".join(map(re.escape, ("battery", "storage", "solar", "renewable", "pv", "mw", "grid", "energy"))))
+
 
 def scrape_uk_news_solar_portal(
     save_csv: bool = True,
@@ -27,42 +45,44 @@ def scrape_uk_news_solar_portal(
 ) -> list[dict]:
     """Scrape Solar Power Portal for battery storage / UK solar headlines."""
     try:
-        source = (SOURCES.get("uk") or {}).get("solar_power_portal") or {"name": "Solar Power Portal – UK battery storage", "url": BASE_URL, "country": "UK"}
-        country = source.get("country", "UK")
-        source_name = source.get("name", "Solar Power Portal")
+        country = _SRC["country"]
+        source_name = _SRC["name"]
 
         html = None
         url = BASE_URL
         for try_url in BATTERY_SECTIONS:
             try:
-                html = fetch_html(try_url)
+                html = fetch_html_cached(try_url)
                 url = try_url
                 break
             except Exception:
                 continue
         if not html:
             return []
-        soup = parse_html(html)
         rows = []
         scraped_at = datetime.now(timezone.utc).isoformat()
         seen = set()
 
-        for a in soup.find_all("a", href=True):
-            href = (a.get("href") or "").strip()
-            if "solarpowerportal.co.uk" not in href:
+        # C-level link walk instead of soup + find_all('a')
+        for href, title in iter_links(html):
+            href = href.strip()
+            parts = urlsplit(href)
+            if "solarpowerportal.co.uk" not in parts.netloc:
+                continue
+            # Dedup on the path so query/fragment variants of one article collapse
+            if parts.path in seen:
                 continue
-            if href in seen or "/tag/" in href or "/author/" in href or "/page/" in href or "/category/" in href:
+            seg = parts.path.split("/", 2)
+            if len(seg) > 1 and seg[1] in _BAD_SEGMENTS:
                 continue
-            title = (a.get_text(strip=True) or "").strip()
             if len(title) < 10 or len(title) > 280:
                 continue
             # Keep articles about solar, storage, battery, renewable, or capacity (MW)
-            tl = title.lower()
-            if not any(k in tl for k in ("battery", "storage", "solar", "renewable", "pv", "mw", "grid", "energy")):
+            if not _TOPIC_KW_RE.search(title.lower()):
                 continue
-            seen.add(href)
+            seen.add(parts.path)
             full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
-            m = re.search(r"[\d.]+\s*MW|[\d.]+\s*GW|[\d.]+\s*MWh", title, re.IGNORECASE)
+            m = _RE_CAPACITY.search(title) if _DIGITS.intersection(title) else None
             cap_str = m.group(0) if m else ""
             cap_num = parse_capacity_mw(cap_str) if cap_str else None
             row = make_row(
@@ -72,8 +92,8 @@ def scrape_uk_news_solar_portal(
                 capacity_mw=cap_str,
                 capacity_mw_numeric=cap_num,
                 status="News",
+                scraped_at=scraped_at,
             )
-            row["scraped_at"] = scraped_at
             rows.append(row)
             if len(rows) >= MAX_ARTICLES:
                 break
@@ -3,15 +3,41 @@ UK BESS / Solar – Planning Inspectorate (PINS) NSIP register.
 Nationally Significant Infrastructure Projects (>50MW solar, etc.).
 """
 
-import re
+import csv
+import io
 from urllib.parse import urljoin
 
-from .base import fetch_html, parse_html, requests_get_with_retry, save_results
+from .base import fetch_html, parse_html, parse_html_fast, parse_html_lxml, requests_get_with_retry, save_results
 from .uk_common import make_row, parse_capacity_mw, normalise_status
 from config import SOURCES
 
+try:
+    from lxml import etree as _etree
+except ImportError:
+    _etree = None
+
+if _etree is not None:
+    # Precompiled XPath equivalents of the CSS selectors below: compiling once at
+    # import removes the per-card selector translation from the card loop
+    _CARD_XP = _etree.XPath(
+        "//*[@data-project] | //*[contains(@class,'project-card')] | //table//tbody//tr | //article"
+    )
+    _NAME_XP = _etree.XPath(
+        ".//h2 | .//h3 | .//*[contains(@class,'project-name')] | .//*[@data-project-name] | .//td[1] | .//a"
+    )
+    _LINK_XP = _etree.XPath(".//a[contains(@href,'project')]")
+    _STAGE_XP = _etree.XPath(".//*[contains(@class,'stage')] | .//*[@data-stage] | .//td[2]")
+    _ROW_XP = _etree.XPath("//table//tr")
+
 PINS_SEARCH_URL = "https://national-infrastructure-consenting.planninginspectorate.gov.uk/project-search"
 PINS_BASE = "https://national-infrastructure-consenting.planninginspectorate.gov.uk"
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "Planning Inspectorate – NSIP (Nationally Significant Infrastructure)",
+    "url": PINS_SEARCH_URL,
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("pins_nsip") or {}),
+}
 REQUEST_TIMEOUT = 45
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -27,7 +53,11 @@ def _fetch_pins_energy_projects() -> list[dict]:
         r = requests_get_with_retry(api_url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT})
     except Exception:
         r = None
-    if r and r.status_code == 200 and r.text.strip():
+    # Sniff from a byte prefix: every r.text access re-decodes the whole body,
+    # so the old r.text.strip()/lstrip()/"\n" in r.text checks each cost a full
+    # copy of a potentially multi-MB download
+    prefix = r.content[:512].lstrip() if r is not None and r.status_code == 200 else b""
+    if prefix:
         try:
             # Could be CSV or JSON
             ct = (r.headers.get("Content-Type") or "").lower()
@@ -36,24 +66,84 @@ def _fetch_pins_energy_projects() -> list[dict]:
                 items = data if isinstance(data, list) else data.get("applications", data.get("data", []))
                 if items:
                     return items
-            if "csv" in ct or r.text.lstrip().startswith("Project") or "\n" in r.text:
-                lines = r.text.strip().split("\n")
-                if len(lines) < 2:
+            if "csv" in ct or prefix.startswith(b"Project") or b"\n" in prefix:
+                # csv.reader is a C state machine: no per-line quote-aware regex
+                # splitting, and embedded newlines in quoted fields parse correctly
+                reader = csv.reader(io.StringIO(r.text))
+                headers = [h.strip() for h in next(reader, [])]
+                if not headers:
                     return []
-                headers = [h.strip().strip('"') for h in lines[0].split(",")]
                 out = []
-                for line in lines[1:]:
-                    vals = [v.strip().strip('"') for v in re.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)', line)]
+                for vals in reader:
+                    if not vals:
+                        continue
+                    vals = [v.strip() for v in vals]
                     if len(vals) >= len(headers):
-                        out.append(dict(zip(headers, vals[:len(headers)])))
-                    elif vals:
-                        out.append({"raw": line, "Project Name": vals[0] if vals else ""})
+                        out.append(dict(zip(headers, vals)))
+                    else:
+                        out.append({"raw": ",".join(vals), "Project Name": vals[0]})
                 return out
         except Exception:
             pass
     # Fallback: scrape project search page (energy sector)
     try:
         html = fetch_html(f"{PINS_SEARCH_URL}?sector=energy&itemsPerPage=100")
+        # Fast path: selectolax (C HTML engine + C CSS matching) when installed —
+        # this parse + multi-selector scan dominates the scraper's CPU time
+        tree = parse_html_fast(html)
+        if tree is not None:
+            projects = []
+            for card in tree.css("[data-project], .project-card, table tbody tr, article"):
+                name_el = card.css_first("h2, h3, .project-name, [data-project-name], td:first-child, a")
+                name = (name_el.text(strip=True) if name_el else "").strip()
+                if not name or len(name) < 3:
+                    continue
+                link = card.css_first("a[href*='project']")
+                href = ((link.attributes.get("href") or "") if link else "").strip()
+                url = urljoin(PINS_BASE, href) if href else PINS_SEARCH_URL
+                stage_el = card.css_first(".stage, [data-stage], td:nth-child(2)")
+                stage = (stage_el.text(strip=True) if stage_el else "").strip()
+                projects.append({"Project Name": name, "Stage": stage, "url": url})
+            if projects:
+                return projects
+            for row in tree.css("table tr"):
+                cells = row.css("td")
+                if len(cells) >= 2:
+                    name = cells[0].text(strip=True).strip()
+                    stage = cells[1].text(strip=True).strip()
+                    a = row.css_first("a[href]")
+                    a_href = (a.attributes.get("href") or "") if a else ""
+                    url = urljoin(PINS_BASE, a_href) if a_href else PINS_SEARCH_URL
+                    if name:
+                        projects.append({"Project Name": name, "Stage": stage, "url": url})
+            return projects
+        # Next-fastest path: lxml with the precompiled XPaths above
+        doc = parse_html_lxml(html) if _etree is not None else None
+        if doc is not None:
+            projects = []
+            for card in _CARD_XP(doc):
+                name_els = _NAME_XP(card)
+                name = " ".join(name_els[0].text_content().split()) if name_els else ""
+                if not name or len(name) < 3:
+                    continue
+                links = _LINK_XP(card)
+                href = (links[0].get("href") or "").strip() if links else ""
+                url = urljoin(PINS_BASE, href) if href else PINS_SEARCH_URL
+                stage_els = _STAGE_XP(card)
+                stage = " ".join(stage_els[0].text_content().split()) if stage_els else ""
+                projects.append({"Project Name": name, "Stage": stage, "url": url})
+            if projects:
+                return projects
+            for row in _ROW_XP(doc):
+                cells = row.findall("td")
+                if len(cells) >= 2:
+                    name = " ".join(cells[0].text_content().split())
+                    stage = " ".join(cells[1].text_content().split())
+                    a = row.find(".//a[@href]")
+                    url = urljoin(PINS_BASE, a.get("href")) if a is not None else PINS_SEARCH_URL
+                    if name:
+                        projects.append({"Project Name": name, "Stage": stage, "url": url})
+            return projects
         soup = parse_html(html)
         projects = []
         # Common patterns: project cards, table rows, or data attributes
@@ -92,13 +182,8 @@ def scrape_uk_pins_nsip(
     date_suffix: str | None = None,
 ) -> list[dict]:
     """Scrape PINS NSIP register for energy (solar/BESS) projects. Returns list of standard rows."""
-    source = SOURCES["uk"].get("pins_nsip") or {
-        "name": "Planning Inspectorate – NSIP (Nationally Significant Infrastructure)",
-        "url": PINS_SEARCH_URL,
-        "country": "UK",
-    }
-    country = source["country"]
-    source_name = source["name"]
+    country = _SRC["country"]
+    source_name = _SRC["name"]
 
     raw = _fetch_pins_energy_projects()
     rows = []
@@ -5,16 +5,29 @@ Fetches latest quarterly CSV from gov.uk and filters for electricity storage pro
 
 import io
 import re
+from datetime import datetime, timezone
 from urllib.parse import urljoin
 
-import pandas as pd
+from bs4 import SoupStrainer
 
-from .base import fetch_html, fetch_html_with_retry, parse_html, requests_get_with_retry, save_results
+from .base import detect_csv_encoding, fetch_html, fetch_html_with_retry, parse_html, requests_get_with_retry, save_results
 from .uk_common import make_row, normalise_status
 from config import SOURCES
 
+# The gov.uk publication page is large; only anchors are needed, so skip
+# building the rest of the tree
+_A_STRAINER = SoupStrainer("a", href=True)
+
 REPD_PUBLICATION_URL = "https://www.gov.uk/government/publications/renewable-energy-planning-database-monthly-extract"
 ASSETS_BASE = "https://assets.publishing.service.gov.uk"
+
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "DESNZ – Renewable Energy Planning Database (REPD)",
+    "url": REPD_PUBLICATION_URL,
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("uk_repd") or {}),
+}
 REQUEST_TIMEOUT = 60
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -25,13 +38,14 @@ USER_AGENT = (
 def _find_latest_csv_url() -> str | None:
     """Get the latest REPD CSV download link from the gov.uk publication page."""
     html = fetch_html_with_retry(REPD_PUBLICATION_URL, timeout=60)
-    soup = parse_html(html)
+    soup = parse_html(html, parse_only=_A_STRAINER)
     candidates = []
     for a in soup.find_all("a", href=True):
         href = (a.get("href") or "").strip()
         if not href.endswith(".csv"):
             continue
-        if "REPD" in href.upper() or "renewable" in href.lower() or "planning" in href.lower():
+        hlow = href.lower()
+        if "repd" in hlow or "renewable" in hlow or "planning" in hlow:
             full = href if href.startswith("http") else (urljoin("https://www.gov.uk", href) if href.startswith("/") else urljoin(ASSETS_BASE, href))
             candidates.append(full)
     if candidates:
@@ -44,16 +58,38 @@ def _find_latest_csv_url() -> str | None:
     return None
 
 
-def _download_csv(url: str) -> pd.DataFrame:
-    """Download CSV and return as DataFrame. Tries utf-8, then latin-1/cp1252 for gov.uk files."""
+def _download_csv(url: str) -> "pd.DataFrame":
+    """Download CSV and return as DataFrame. The body is streamed straight into
+    the parser (raw bytes never sit in memory next to the DataFrame); encoding
+    is sniffed from the buffered prefix. A failed streamed attempt re-downloads
+    once and parses from memory."""
+    import pandas as pd  # deferred: keeps module import (and cold start) pandas-free
+
+    try:
+        # pyarrow engine: multithreaded C parse, much faster on this wide,
+        # string-heavy file. Plain numpy dtypes keep downstream code unchanged.
+        import pyarrow  # noqa: F401
+        engine_kwargs = {"engine": "pyarrow"}
+    except ImportError:
+        engine_kwargs = {"low_memory": False}
+
+    try:
+        resp = requests_get_with_retry(
+            url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT}, stream=True
+        )
+        resp.raw.decode_content = True  # transparently inflate gzip/deflate bodies
+        buffered = io.BufferedReader(resp.raw, buffer_size=65536)
+        enc = detect_csv_encoding(buffered.peek(65536))
+        return pd.read_csv(buffered, encoding=enc, **engine_kwargs)
+    except Exception:
+        pass  # stream died or encoding guess missed; the stream can't rewind
+
     resp = requests_get_with_retry(url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT})
     raw = resp.content
-    for enc in ("utf-8", "utf-8-sig", "latin-1", "cp1252"):
-        try:
-            return pd.read_csv(io.BytesIO(raw), encoding=enc, low_memory=False)
-        except UnicodeDecodeError:
-            continue
-    return pd.read_csv(io.BytesIO(raw), encoding="latin-1", low_memory=False)
+    try:
+        return pd.read_csv(io.BytesIO(raw), encoding=detect_csv_encoding(raw), **engine_kwargs)
+    except ValueError:  # bad encoding guess or a file pyarrow rejects
+        return pd.read_csv(io.BytesIO(raw), encoding="latin-1", low_memory=False)
 
 
 def scrape_uk_repd(
@@ -63,13 +99,8 @@ def scrape_uk_repd(
 ) -> list[dict]:
     """Scrape UK REPD for electricity storage projects. Returns list of standard rows."""
     try:
-        source = (SOURCES.get("uk") or {}).get("uk_repd") or {
-            "name": "DESNZ – Renewable Energy Planning Database (REPD)",
-            "url": REPD_PUBLICATION_URL,
-            "country": "UK",
-        }
-        country = source.get("country", "UK")
-        source_name = source.get("name", "REPD")
+        country = _SRC["country"]
+        source_name = _SRC["name"]
 
         csv_url = _find_latest_csv_url()
         if not csv_url:
@@ -87,8 +118,21 @@ def scrape_uk_repd(
         if not tech_col:
             return []
 
-        tech_vals = df[tech_col].astype(str).str.lower()
-        storage_mask = tech_vals.str.contains("storage", na=False)
+        import numpy as np
+
+        # Technology type holds a few dozen distinct labels across the whole
+        # register; as category dtype the substring test runs once per label
+        # and an indexed take broadcasts the verdicts back over the rows,
+        # instead of lowercasing and scanning every row's string
+        tech_series = df[tech_col].astype("category")
+        label_mask = np.asarray(
+            tech_series.cat.categories.astype(str).str.lower().str.contains("storage", na=False)
+        )
+        codes = tech_series.cat.codes.to_numpy()
+        if label_mask.size:
+            storage_mask = np.where(codes >= 0, label_mask[codes], False)
+        else:  # column was all-NaN: no categories, nothing to keep
+            storage_mask = np.zeros(len(df), dtype=bool)
         df = df.loc[storage_mask].copy()
         if df.empty:
             return []
@@ -101,33 +145,41 @@ def scrape_uk_repd(
         region_col = find_col("region") or find_col("county")
         country_col = find_col("country")
 
+        import pandas as pd
+
+        # Columnar build instead of iterrows: each needed column becomes one list
+        # up front rather than a Series lookup per cell per row
+        names = df[site_col].astype(str).str.strip().tolist() if site_col else [""] * len(df)
+        cap_nums = pd.to_numeric(df[cap_col], errors="coerce").tolist() if cap_col else [None] * len(df)
+        statuses = df[status_col].astype(str).str.strip().tolist() if status_col else [""] * len(df)
+        regions = df[region_col].astype(str).str.strip().tolist() if region_col else [""] * len(df)
+        countries = df[country_col].astype(str).str.strip().tolist() if country_col else ["UK"] * len(df)
+        # Development status has ~10 distinct values across hundreds of thousands
+        # of rows; classify each distinct value once instead of once per row
+        status_lookup = {s: normalise_status(s)[0] for s in set(statuses)}
+
         rows = []
-        for _, r in df.iterrows():
-            site_name = str(r[site_col]).strip() if site_col and site_col in r.index else ""
+        scraped_at = datetime.now(timezone.utc).isoformat()  # one stamp for the batch
+        for site_name, cap_num, status, region, country_val in zip(names, cap_nums, statuses, regions, countries):
             if not site_name or site_name == "nan":
                 continue
-            cap_val = r[cap_col] if cap_col and cap_col in r.index else None
-            try:
-                capacity_mw_numeric = float(cap_val) if cap_val is not None and str(cap_val) != "nan" else None
-            except (TypeError, ValueError):
-                capacity_mw_numeric = None
-            capacity_mw = f"{capacity_mw_numeric} MW" if capacity_mw_numeric is not None else ""
-            status = str(r[status_col]).strip() if status_col and status_col in r.index else ""
-            region = str(r[region_col]).strip() if region_col and region_col in r.index else ""
-            country_val = str(r[country_col]).strip() if country_col and country_col in r.index else "UK"
+            if cap_num is not None and cap_num != cap_num:  # NaN -> None
+                cap_num = None
+            capacity_mw = f"{cap_num} MW" if cap_num is not None else ""
             if region == "nan":
                 region = ""
             if country_val == "nan":
                 country_val = "UK"
-            std_status, _ = normalise_status(status)
+            std_status = status_lookup[status]
             row = make_row(
                 site_name=site_name,
                 source_name=source_name,
                 url=REPD_PUBLICATION_URL,
                 region=region,
                 capacity_mw=capacity_mw,
-                capacity_mw_numeric=capacity_mw_numeric,
+                capacity_mw_numeric=cap_num,
                 status=std_status,
+                scraped_at=scraped_at,
             )
             row["country"] = country_val
             rows.append(row)
@@ -3,6 +3,7 @@ UK BESS – Root Power our-projects page (BESS portfolio).
 """
 
 import re
+import sys
 from urllib.parse import urljoin
 
 from .base import fetch_html, parse_html, save_results
@@ -11,6 +12,21 @@ from config import SOURCES
 
 BASE = "https://www.root-power.com"
 
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "Root Power – BESS Projects",
+    "url": "https://www.root-power.com/our-projects/",
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("root_power") or {}),
+}
+
+# Compiled once at import: these run per anchor in the scan below
+_RE_MW = re.compile(r"([\d.]+)\s*MW", re.IGNORECASE)
+_RE_STRIP_MW = re.compile(r"\s*[—–-]\s*[\d.]+\s*MW\s*$", re.IGNORECASE)
+_RE_PARENT_CLASS = re.compile(r"project|card|item")
+# One alternation scan instead of six substring passes plus a lower() copy
+_RE_STATUS = re.compile(r"construction|consented|advanced|planning|energised|operational", re.IGNORECASE)
+
 
 def scrape_uk_root_power(
     save_csv: bool = True,
@@ -19,10 +35,9 @@ def scrape_uk_root_power(
 ) -> list[dict]:
     """Scrape Root Power BESS projects (Site Name, Size, Status)."""
     try:
-        source = (SOURCES.get("uk") or {}).get("root_power") or {"name": "Root Power – BESS Projects", "url": "https://www.root-power.com/our-projects/", "country": "UK"}
-        url = source.get("url", BASE)
-        country = source.get("country", "UK")
-        source_name = source.get("name", "Root Power")
+        url = _SRC["url"]
+        country = _SRC["country"]
+        source_name = _SRC["name"]
 
         html = fetch_html(url)
         soup = parse_html(html)
@@ -34,7 +49,8 @@ def scrape_uk_root_power(
             href = a.get("href", "")
             if "/projects/" not in href and "/our-projects/" not in href:
                 continue
-            if "bess" not in href.lower() and "battery" not in href.lower():
+            hlow = href.lower()
+            if "bess" not in hlow and "battery" not in hlow:
                 txt = (a.get_text(strip=True) or "").lower()
                 if "bess" not in txt and "battery" not in txt and "mw" not in txt:
                     continue
@@ -42,26 +58,29 @@ def scrape_uk_root_power(
             link_text = (a.get_text(strip=True) or "").strip()
             name = link_text
             cap_str = ""
-            m = re.search(r"([\d.]+)\s*MW", link_text, re.IGNORECASE)
+            m = _RE_MW.search(link_text)
             if m:
                 cap_str = m.group(0)
-                name = re.sub(r"\s*[—–-]\s*[\d.]+\s*MW\s*$", "", link_text, flags=re.IGNORECASE).strip()
+                name = _RE_STRIP_MW.sub("", link_text).strip()
             if not name or len(name) > 150:
                 continue
-            key = (name.lower()[:80], cap_str)
+            # Slice before lowering so only the kept prefix is converted; intern both
+            # parts — repeated names (nav + card link to the same project) then share
+            # one string object and hash once
+            key = (sys.intern(name[:80].lower()), sys.intern(cap_str))
             if key in seen:
                 continue
             seen.add(key)
-            parent = a.find_parent("article") or a.find_parent("div", class_=re.compile(r"project|card|item")) or a.find_parent("li")
+            parent = a.find_parent("article") or a.find_parent("div", class_=_RE_PARENT_CLASS) or a.find_parent("li")
             status = ""
             if parent:
                 for p in parent.find_all(["p", "span", "div"]):
                     t = (p.get_text(strip=True) or "").strip()
                     if "MW" in t and not cap_str:
-                        mm = re.search(r"([\d.]+)\s*MW", t)
+                        mm = _RE_MW.search(t)
                         if mm:
                             cap_str = mm.group(0)
-                    if any(x in t.lower() for x in ("construction", "consented", "advanced", "planning", "energised", "operational")):
+                    if _RE_STATUS.search(t):
                         status = t[:80]
                         break
             num = parse_capacity_mw(cap_str) if cap_str else None
@@ -11,6 +11,18 @@ from config import SOURCES
 
 BASE = "https://www.sserenewables.com"
 
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "SSE Renewables – Battery Storage",
+    "url": "https://www.sserenewables.com/our-sites/",
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("sse_renewables") or {}),
+}
+
+# Compiled once at import: these run per ancestor hop in the walks below
+_RE_MW_MWH = re.compile(r"(\d+(?:\.\d+)?)\s*MW\s*(?:/\s*\d+\s*MWh)?")
+_RE_MW = re.compile(r"(\d+(?:\.\d+)?)\s*MW")
+
 
 def scrape_uk_sse_bess(
     save_csv: bool = True,
@@ -19,29 +31,43 @@ def scrape_uk_sse_bess(
 ) -> list[dict]:
     """Scrape SSE Renewables site list for BESS projects."""
     try:
-        source = (SOURCES.get("uk") or {}).get("sse_renewables") or {"name": "SSE Renewables – Battery Storage", "url": "https://www.sserenewables.com/our-sites/", "country": "UK"}
-        url = source.get("url", BASE)
-        country = source.get("country", "UK")
-        source_name = source.get("name", "SSE Renewables")
+        url = _SRC["url"]
+        country = _SRC["country"]
+        source_name = _SRC["name"]
 
         html = fetch_html(url)
         soup = parse_html(html)
         rows = []
         seen = set()
 
+        # Anchors in the same card/section walk the same ancestors, and get_text
+        # re-walks the whole subtree on every call — cache per element (the soup
+        # keeps every element alive, so id() is a stable key here)
+        text_cache: dict[int, str] = {}
+
+        def _parent_text(el) -> str:
+            t = text_cache.get(id(el))
+            if t is None:
+                t = el.get_text()
+                text_cache[id(el)] = t
+            return t
+
         # Primary: links with "BESS" or "battery" and capacity in parent/sibling
         for a in soup.find_all("a", href=True):
-            link_text = (a.get_text(strip=True) or "").strip()
+            # href checks first: get_text walks the subtree, so only run it on links
+            # that survive the cheap attribute filter
             href = a.get("href", "")
             if not href or href.startswith("#"):
                 continue
-            if "BESS" not in link_text and "battery" not in link_text.lower() and "storage" not in link_text.lower():
+            link_text = (a.get_text(strip=True) or "").strip()
+            tlow = link_text.lower()
+            if "BESS" not in link_text and "battery" not in tlow and "storage" not in tlow:
                 continue
             project_url = urljoin(BASE, href)
             name = link_text
             if not name or len(name) > 200:
                 continue
-            key = (name.lower()[:80], href)
+            key = (name[:80].lower(), href)  # slice first: only 80 chars get lowercased
             if key in seen:
                 continue
             seen.add(key)
@@ -50,16 +76,18 @@ def scrape_uk_sse_bess(
             for _ in range(6):
                 if not parent:
                     break
-                t = parent.get_text() if hasattr(parent, "get_text") else ""
-                m = re.search(r"(\d+(?:\.\d+)?)\s*MW\s*(?:/\s*\d+\s*MWh)?", t)
+                # find_parent only ever returns a Tag or None, so the hasattr
+                # guards were dead weight on a hot inner loop
+                t = _parent_text(parent)
+                m = _RE_MW_MWH.search(t)
                 if m:
                     cap_str = m.group(1) + " MW"
                     break
-                parent = parent.find_parent() if hasattr(parent, "find_parent") else None
+                parent = parent.find_parent()
             num = parse_capacity_mw(cap_str) if cap_str else None
             status = "Planned"
-            if parent and hasattr(parent, "get_text"):
-                pt = parent.get_text().lower()
+            if parent is not None:
+                pt = _parent_text(parent).lower()
                 if "operational" in pt or "energised" in pt:
                     status = "Operational"
                 elif "construction" in pt:
@@ -90,15 +118,16 @@ def scrape_uk_sse_bess(
                 for _ in range(5):
                     if not parent:
                         break
-                    t = parent.get_text() if hasattr(parent, "get_text") else ""
-                    if re.search(r"\d+\s*MW", t):
-                        mm = re.search(r"(\d+(?:\.\d+)?)\s*MW", t)
-                        cap_str = (mm.group(1) + " MW") if mm else ""
+                    t = _parent_text(parent)
+                    mm = _RE_MW.search(t)  # one search; the old probe regex duplicated it
+                    if mm:
+                        cap_str = mm.group(1) + " MW"
                         break
-                    parent = parent.find_parent() if hasattr(parent, "find_parent") else None
-                if (name.lower()[:80], href) in seen:
+                    parent = parent.find_parent()
+                key = (name[:80].lower(), href)
+                if key in seen:
                     continue
-                seen.add((name.lower()[:80], href))
+                seen.add(key)
                 rows.append(make_row(
                     site_name=name,
                     source_name=source_name,
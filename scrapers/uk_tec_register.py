@@ -5,15 +5,23 @@ Transmission Entry Capacity: projects with grid connection agreements.
 
 import io
 import re
+from datetime import datetime, timezone
 from urllib.parse import urljoin
 
-import pandas as pd
-
-from .base import save_results, requests_get_with_retry
+from .base import detect_csv_encoding, save_results, requests_get_with_retry
 from .uk_common import make_row, parse_capacity_mw
 from config import SOURCES
 
 TEC_PORTAL_URL = "https://www.nationalgrideso.com/data-portal/transmission-entry-capacity-tec-register"
+# Anchor hrefs pulled straight from raw markup in the portal-page fallback
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+# Resolved once at import: defaults merged with any config override
+_SRC = {
+    "name": "NESO – TEC Register (Transmission Entry Capacity)",
+    "url": TEC_PORTAL_URL,
+    "country": "UK",
+    **((SOURCES.get("uk") or {}).get("tec_register") or {}),
+}
 # NESO CKAN-style API (dataset UUID from data portal)
 TEC_API_BASE = "https://api.nationalgrideso.com"
 TEC_PACKAGE_ID = "cbd45e54-e6e2-4a38-99f1-8de6fd96d7c1"
@@ -56,14 +64,16 @@ def _get_tec_csv_url() -> str | None:
         return None
     except Exception:
         pass
-    # Fallback: fetch portal HTML and look for CSV link
+    # Fallback: fetch portal HTML and look for CSV link. One regex pass over the
+    # raw markup — this branch only needs a single href, so even a strained
+    # parse tree is overkill
     try:
-        from .base import fetch_html, parse_html
+        from .base import fetch_html
         html = fetch_html(TEC_PORTAL_URL)
-        soup = parse_html(html)
-        for a in soup.find_all("a", href=True):
-            href = (a.get("href") or "").strip()
-            if "tec" in href.lower() and (href.endswith(".csv") or "download" in href.lower()):
+        for href in _HREF_RE.findall(html):
+            href = href.strip()
+            hlow = href.lower()
+            if "tec" in hlow and (hlow.endswith(".csv") or "download" in hlow):
                 if href.startswith("http"):
                     return href
                 return urljoin(TEC_PORTAL_URL, href)
@@ -79,16 +89,38 @@ def _get_tec_csv_url() -> str | None:
     return None
 
 
-def _download_csv(url: str) -> pd.DataFrame:
-    """Download CSV and return as DataFrame."""
+def _download_csv(url: str) -> "pd.DataFrame":
+    """Download CSV and return as DataFrame. The body is streamed straight into
+    the parser (raw bytes never sit in memory next to the DataFrame); encoding
+    is sniffed from the buffered prefix. A failed streamed attempt re-downloads
+    once and parses from memory."""
+    import pandas as pd  # deferred: keeps module import (and cold start) pandas-free
+
+    try:
+        # pyarrow engine: multithreaded C parse, much faster on this wide,
+        # string-heavy file. Plain numpy dtypes keep downstream code unchanged.
+        import pyarrow  # noqa: F401
+        engine_kwargs = {"engine": "pyarrow"}
+    except ImportError:
+        engine_kwargs = {"low_memory": False}
+
+    try:
+        resp = requests_get_with_retry(
+            url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT}, stream=True
+        )
+        resp.raw.decode_content = True  # transparently inflate gzip/deflate bodies
+        buffered = io.BufferedReader(resp.raw, buffer_size=65536)
+        enc = detect_csv_encoding(buffered.peek(65536))
+        return pd.read_csv(buffered, encoding=enc, **engine_kwargs)
+    except Exception:
+        pass  # stream died or encoding guess missed; the stream can't rewind
+
     resp = requests_get_with_retry(url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT})
     raw = resp.content
-    for enc in ("utf-8", "utf-8-sig", "latin-1", "cp1252"):
-        try:
-            return pd.read_csv(io.BytesIO(raw), encoding=enc, low_memory=False)
-        except UnicodeDecodeError:
-            continue
-    return pd.read_csv(io.BytesIO(raw), encoding="latin-1", low_memory=False)
+    try:
+        return pd.read_csv(io.BytesIO(raw), encoding=detect_csv_encoding(raw), **engine_kwargs)
+    except ValueError:  # bad encoding guess or a file pyarrow rejects
+        return pd.read_csv(io.BytesIO(raw), encoding="latin-1", low_memory=False)
 
 
 def scrape_uk_tec_register(
@@ -97,13 +129,8 @@ def scrape_uk_tec_register(
     date_suffix: str | None = None,
 ) -> list[dict]:
     """Scrape NESO TEC Register for transmission-connected projects. Returns list of standard rows."""
-    source = SOURCES["uk"].get("tec_register") or {
-        "name": "NESO – TEC Register (Transmission Entry Capacity)",
-        "url": TEC_PORTAL_URL,
-        "country": "UK",
-    }
-    country = source["country"]
-    source_name = source["name"]
+    country = _SRC["country"]
+    source_name = _SRC["name"]
 
     csv_url = _get_tec_csv_url()
     if not csv_url:
@@ -123,36 +150,44 @@ def scrape_uk_tec_register(
     tech_col = find_col("technology") or find_col("tech")
     region_col = find_col("region") or find_col("zone") or find_col("area")
 
+    import pandas as pd
+
+    # Columnar build instead of iterrows: each needed column becomes one list
+    # up front rather than a Series lookup per cell per row
+    names = df[name_col].astype(str).str.strip().tolist() if name_col else [""] * len(df)
+    if cap_col:
+        # One C-loop cast for the whole column; only the stragglers it can't
+        # coerce go through the Python text parser
+        cap_series = pd.to_numeric(df[cap_col], errors="coerce")
+        needs_parse = cap_series.isna() & df[cap_col].notna()
+        if needs_parse.any():
+            cap_series[needs_parse] = df.loc[needs_parse, cap_col].astype(str).map(parse_capacity_mw)
+        cap_nums = cap_series.tolist()
+    else:
+        cap_nums = [None] * len(df)
+    regions = df[region_col].astype(str).str.strip().tolist() if region_col else [""] * len(df)
+
     rows = []
-    for _, r in df.iterrows():
-        site_name = ""
-        if name_col and name_col in r.index:
-            site_name = str(r[name_col]).strip()
+    scraped_at = datetime.now(timezone.utc).isoformat()  # one stamp for the batch
+    for site_name, cap_num, region in zip(names, cap_nums, regions):
         if not site_name or site_name == "nan":
             continue
-        cap_val = r[cap_col] if cap_col and cap_col in r.index else None
-        try:
-            capacity_mw_numeric = float(cap_val) if cap_val is not None and str(cap_val) != "nan" else None
-        except (TypeError, ValueError):
-            capacity_mw_numeric = parse_capacity_mw(str(cap_val)) if cap_val else None
-        capacity_mw = f"{capacity_mw_numeric} MW" if capacity_mw_numeric is not None else ""
-        region = ""
-        if region_col and region_col in r.index:
-            region = str(r[region_col]).strip()
+        if cap_num is not None and cap_num != cap_num:  # residual NaN -> None
+            cap_num = None
+        capacity_mw = f"{cap_num} MW" if cap_num is not None else ""
         if region == "nan":
             region = ""
         # TEC = grid connection agreement; treat as Consented / early-stage for investment mapping
-        status = "Consented"
-        row = make_row(
+        rows.append(make_row(
             site_name=site_name,
             source_name=source_name,
             url=TEC_PORTAL_URL,
             region=region,
             capacity_mw=capacity_mw,
-            capacity_mw_numeric=capacity_mw_numeric,
-            status=status,
-        )
-        rows.append(row)
+            capacity_mw_numeric=cap_num,
+            status="Consented",
+            scraped_at=scraped_at,
+        ))
 
     if rows:
         save_results(rows, country, "tec_register", csv=save_csv, json_file=save_json, date_suffix=date_suffix)